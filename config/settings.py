@@ -3,115 +3,154 @@ Configuration loader for Job Finder.
 Loads environment variables, YAML configs (profile.yaml, scoring_rules.yaml).
 """
 
+import functools
+import hashlib
 import os
+import pickle
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
-import yaml
+from typing import Any, Callable, ClassVar, Dict, Optional
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
 
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-class Settings(BaseModel):
-    """Main settings class for Job Finder application."""
+# User agents rotated by scrapers
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+)
+
+
+# Directories already created by Settings in this process
+_ENSURED_DIRS: set = set()
+
+
+def _env_bool(value: str) -> bool:
+    """Parse boolean environment variable ("true"/"false")."""
+    return value.lower() == "true"
+
+
+# Placeholder default for fields filled from the environment in __post_init__
+_FROM_ENV: Any = object()
+
+
+def _memoized(method: Callable) -> Callable:
+    """Memoize a Settings method in the instance's _memo dict (freed with it)."""
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        key = (method.__name__, *args)
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = method(self, *args)
+            return result
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Main settings class for Job Finder application.
+    
+    Plain frozen dataclass: values come from trusted environment variables,
+    so construction skips Pydantic schema validation. Keyword arguments
+    override environment values; env parsing (driven by _ENV_SCHEMA) and
+    checks run in __post_init__.
+    """
     
     # Directories
-    project_root: Path = Field(default_factory=lambda: Path(__file__).parent.parent)
-    config_dir: Path = Field(default_factory=lambda: Path(__file__).parent)
-    logs_dir: Path = Field(default="logs")
-    cache_dir: Path = Field(default="cache")
+    project_root: Path = field(default_factory=lambda: Path(__file__).parent.parent)
+    config_dir: Path = field(default_factory=lambda: Path(__file__).parent)
+    logs_dir: Path = Path("logs")
+    cache_dir: Path = Path("cache")
     
     # Google Sheets configuration
-    google_sheets_credentials_path: str = Field(
-        default="./config/google_credentials.json",
-        description="Path to Google Service Account credentials JSON"
-    )
-    google_sheets_spreadsheet_id: Optional[str] = Field(
-        default=None,
-        description="Google Sheets spreadsheet ID (will be created if not provided)"
-    )
+    # Path to Google Service Account credentials JSON
+    google_sheets_credentials_path: str = _FROM_ENV
+    # Google Sheets spreadsheet ID (will be created if not provided)
+    google_sheets_spreadsheet_id: Optional[str] = _FROM_ENV
     
-    # NLP Mode
-    use_advanced_nlp: bool = Field(
-        default=False,
-        description="Enable advanced spaCy NER (slower, local dev only)"
-    )
+    # NLP Mode: enable advanced spaCy NER (slower, local dev only)
+    use_advanced_nlp: bool = _FROM_ENV
     
     # Scraper configuration
-    scraper_timeout_seconds: int = Field(default=30)
-    scraper_max_retries: int = Field(default=3)
-    scraper_rate_limit_delay: float = Field(
-        default=2.0,
-        description="Seconds between requests to same source"
-    )
+    scraper_timeout_seconds: int = _FROM_ENV
+    scraper_max_retries: int = _FROM_ENV
+    # Seconds between requests to same source
+    scraper_rate_limit_delay: float = _FROM_ENV
     
     # Cache configuration
-    cache_enabled: bool = Field(default=True)
-    cache_ttl_hours: int = Field(default=24)
+    cache_enabled: bool = _FROM_ENV
+    cache_ttl_hours: int = _FROM_ENV
     
     # Logging
-    log_level: str = Field(default="INFO")
-    log_to_file: bool = Field(default=True)
-    log_file_path: str = Field(default="./logs/scraper.log")
+    log_level: str = _FROM_ENV
+    log_to_file: bool = _FROM_ENV
+    log_file_path: str = _FROM_ENV
     
     # Results configuration
-    max_results: int = Field(
-        default=20,
-        description="Maximum number of jobs to write to Google Sheets"
-    )
-    min_score: float = Field(
-        default=60.0,
-        description="Minimum score threshold for results"
-    )
+    # Maximum number of jobs to write to Google Sheets
+    max_results: int = _FROM_ENV
+    # Minimum score threshold for results
+    min_score: float = _FROM_ENV
     
     # Development mode (skip actual scraping, use mock data)
-    dev_mode: bool = Field(default=False)
+    dev_mode: bool = _FROM_ENV
     
-    class Config:
-        env_prefix = ""  # No prefix for environment variables
-        case_sensitive = False
+    # Results of @_memoized methods for this instance
+    _memo: Dict[tuple, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
     
-    def __init__(self, **kwargs):
-        """Initialize settings from environment variables."""
-        # Load from environment
-        env_data = {
-            "google_sheets_credentials_path": os.getenv(
-                "GOOGLE_SHEETS_CREDENTIALS_PATH",
-                "./config/google_credentials.json"
-            ),
-            "google_sheets_spreadsheet_id": os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID"),
-            "use_advanced_nlp": os.getenv("USE_ADVANCED_NLP", "false").lower() == "true",
-            "scraper_timeout_seconds": int(os.getenv("SCRAPER_TIMEOUT_SECONDS", "30")),
-            "scraper_max_retries": int(os.getenv("SCRAPER_MAX_RETRIES", "3")),
-            "scraper_rate_limit_delay": float(os.getenv("SCRAPER_RATE_LIMIT_DELAY", "2.0")),
-            "cache_enabled": os.getenv("CACHE_ENABLED", "true").lower() == "true",
-            "cache_ttl_hours": int(os.getenv("CACHE_TTL_HOURS", "24")),
-            "log_level": os.getenv("LOG_LEVEL", "INFO"),
-            "log_to_file": os.getenv("LOG_TO_FILE", "true").lower() == "true",
-            "log_file_path": os.getenv("LOG_FILE_PATH", "./logs/scraper.log"),
-            "max_results": int(os.getenv("MAX_RESULTS", "20")),
-            "min_score": float(os.getenv("MIN_SCORE", "60")),
-            "dev_mode": os.getenv("DEV_MODE", "false").lower() == "true",
-        }
+    # Environment-backed fields: (field name, env variable, cast, default)
+    _ENV_SCHEMA: ClassVar[tuple] = (
+        ("google_sheets_credentials_path", "GOOGLE_SHEETS_CREDENTIALS_PATH", str,
+         "./config/google_credentials.json"),
+        ("google_sheets_spreadsheet_id", "GOOGLE_SHEETS_SPREADSHEET_ID", str, None),
+        ("use_advanced_nlp", "USE_ADVANCED_NLP", _env_bool, "false"),
+        ("scraper_timeout_seconds", "SCRAPER_TIMEOUT_SECONDS", int, "30"),
+        ("scraper_max_retries", "SCRAPER_MAX_RETRIES", int, "3"),
+        ("scraper_rate_limit_delay", "SCRAPER_RATE_LIMIT_DELAY", float, "2.0"),
+        ("cache_enabled", "CACHE_ENABLED", _env_bool, "true"),
+        ("cache_ttl_hours", "CACHE_TTL_HOURS", int, "24"),
+        ("log_level", "LOG_LEVEL", str, "INFO"),
+        ("log_to_file", "LOG_TO_FILE", _env_bool, "true"),
+        ("log_file_path", "LOG_FILE_PATH", str, "./logs/scraper.log"),
+        ("max_results", "MAX_RESULTS", int, "20"),
+        ("min_score", "MIN_SCORE", float, "60"),
+        ("dev_mode", "DEV_MODE", _env_bool, "false"),
+    )
+    
+    def __post_init__(self):
+        """Fill fields from environment, validate values and create directories."""
+        # Single pass over the schema for fields not passed explicitly
+        environ = os.environ
+        for name, key, cast, default in self._ENV_SCHEMA:
+            if getattr(self, name) is _FROM_ENV:
+                value = environ.get(key, default)
+                object.__setattr__(self, name, cast(value) if value is not None else None)
         
-        # Merge with provided kwargs
-        env_data.update(kwargs)
-        super().__init__(**env_data)
+        for name in ("project_root", "config_dir", "logs_dir", "cache_dir"):
+            object.__setattr__(self, name, Path(getattr(self, name)))
+        
+        object.__setattr__(self, "log_level", self._validate_log_level(self.log_level))
+        object.__setattr__(self, "min_score", self._validate_min_score(self.min_score))
         
         # Ensure directories exist
         self._ensure_directories()
     
     def _ensure_directories(self):
         """Create required directories if they don't exist."""
-        for dir_path in [self.logs_dir, self.cache_dir]:
-            path = self.project_root / dir_path if not Path(dir_path).is_absolute() else Path(dir_path)
-            path.mkdir(parents=True, exist_ok=True)
+        for dir_path in (self.logs_dir, self.cache_dir):
+            path = os.path.join(self.project_root, dir_path)  # absolute dir_path wins
+            if path not in _ENSURED_DIRS:
+                os.makedirs(path, exist_ok=True)
+                _ENSURED_DIRS.add(path)
     
-    @validator("log_level")
-    def validate_log_level(cls, v):
+    @staticmethod
+    def _validate_log_level(v: str) -> str:
         """Validate log level."""
         allowed_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v = v.upper()
@@ -119,17 +158,83 @@ class Settings(BaseModel):
             raise ValueError(f"log_level must be one of {allowed_levels}")
         return v
     
-    @validator("min_score")
-    def validate_min_score(cls, v):
+    @staticmethod
+    def _validate_min_score(v: float) -> float:
         """Validate min_score is between 0 and 100."""
+        v = float(v)
         if not 0 <= v <= 100:
             raise ValueError("min_score must be between 0 and 100")
         return v
     
+    def _config_cache_path(self, filepath: Path) -> Path:
+        """
+        Get pickle cache path for a parsed config file.
+        
+        The name includes a hash of the source path so config files with the
+        same name from different directories don't share a cache entry.
+        """
+        cache_dir = self.cache_dir if self.cache_dir.is_absolute() else self.project_root / self.cache_dir
+        digest = hashlib.sha1(str(filepath.resolve()).encode('utf-8')).hexdigest()[:8]
+        return cache_dir / f"{filepath.name}.{digest}.pkl"
+    
+    def _load_cached(self, filepath: Path, parse: Callable[[Path], Any]) -> Any:
+        """
+        Parse config file, reusing the pickled result while it is fresh.
+        
+        The pickle is used only if it is at least as new as the source file;
+        otherwise the file is parsed and the pickle rewritten. Cache errors
+        are never fatal - the file is simply parsed again.
+        
+        Args:
+            filepath: Config file to load
+            parse: Function parsing the file into Python objects
+        
+        Returns:
+            Parsed file content
+        """
+        if not self.cache_enabled:
+            return parse(filepath)
+        
+        cache_path = self._config_cache_path(filepath)
+        
+        try:
+            if cache_path.stat().st_mtime >= filepath.stat().st_mtime:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        
+        data = parse(filepath)
+        
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError):
+            pass
+        
+        return data
+    
+    @staticmethod
+    def _parse_yaml(filepath: Path) -> Dict[str, Any]:
+        """Parse YAML file (libyaml C loader when available)."""
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=loader)
+            return data or {}
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"Error parsing {filepath.name}: {str(e)}")
+    
+    @_memoized
     def load_yaml(self, filename: str) -> Dict[str, Any]:
         """
         Load YAML configuration file.
         
+        Results are memoized per Settings instance and pickled to
+        cache_dir between runs. The returned dict is shared: treat it as
+        read-only.
+        
         Args:
             filename: Name of YAML file in config directory
         
@@ -148,17 +253,16 @@ class Settings(BaseModel):
                 f"Please create {filename} in the config directory."
             )
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            return data or {}
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Error parsing {filename}: {str(e)}")
+        return self._load_cached(filepath, self._parse_yaml)
     
+    @_memoized
     def load_profile(self):
         """
         Load user profile from profile.yaml.
         
+        Memoized like load_yaml(); the returned Profile is shared: treat
+        it as read-only.
+        
         Returns:
             Profile object
         """
@@ -170,19 +274,40 @@ class Settings(BaseModel):
         """
         Load scoring rules from scoring_rules.yaml.
         
+        Memoized through load_yaml(); the returned dict is shared: treat
+        it as read-only.
+        
         Returns:
             Dictionary with scoring rules
         """
         return self.load_yaml("scoring_rules.yaml")
     
+    @staticmethod
+    def _parse_json(filepath: Path) -> Dict[str, Any]:
+        """Parse JSON file (uses orjson if installed)."""
+        try:
+            import orjson
+            loads = orjson.loads
+        except ImportError:
+            import json
+            loads = json.loads
+        try:
+            return loads(filepath.read_bytes())
+        except ValueError as e:
+            # Both json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
+            raise ValueError(f"Error parsing {filepath.name}: {str(e)}")
+    
+    @_memoized
     def load_tech_dictionary(self) -> Dict[str, Any]:
         """
         Load tech dictionary from tech_dictionary.json.
         
+        Cached like load_yaml(); the returned dict is shared: treat it as
+        read-only.
+        
         Returns:
             Dictionary with tech terms
         """
-        import json
         filepath = self.config_dir / "tech_dictionary.json"
         
         if not filepath.exists():
@@ -191,16 +316,15 @@ class Settings(BaseModel):
                 "Please create tech_dictionary.json in the config directory."
             )
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Error parsing tech_dictionary.json: {str(e)}")
+        return self._load_cached(filepath, self._parse_json)
     
+    @_memoized
     def get_scrapers_config(self) -> Dict[str, Any]:
         """
         Get scraper-specific configuration.
         
+        The result is cached per Settings instance; treat it as read-only.
+        
         Returns:
             Dictionary with scraper settings
         """
@@ -208,11 +332,7 @@ class Settings(BaseModel):
             "timeout": self.scraper_timeout_seconds,
             "max_retries": self.scraper_max_retries,
             "rate_limit_delay": self.scraper_rate_limit_delay,
-            "user_agents": [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
-            ]
+            "user_agents": _USER_AGENTS
         }
     
     def get_cache_config(self) -> Dict[str, Any]:
@@ -241,21 +361,17 @@ class Settings(BaseModel):
         )
 
 
-# Global settings instance (lazy loaded)
-_settings_instance: Optional[Settings] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get global settings instance (singleton pattern).
     
+    Cached with lru_cache, so the instance is built once on first use.
+    
     Returns:
         Settings instance
     """
-    global _settings_instance
-    if _settings_instance is None:
-        _settings_instance = Settings()
-    return _settings_instance
+    return Settings()
 
 
 # For convenience: allow direct import
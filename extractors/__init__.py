@@ -1,5 +1,5 @@
 """Extractors for job data."""
 
-from extractors.tech_extractor import TechStackExtractor
+from extractors.tech_extractor import TechStackExtractor, get_tech_extractor
 
-__all__ = ["TechStackExtractor"]
+__all__ = ["TechStackExtractor", "get_tech_extractor"]
@@ -1,7 +1,12 @@
 """Base extractor class for all extractors."""
 
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Set
+from typing import Any, Set, Union
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_WHITESPACE_BYTES_RE = re.compile(rb'\s+')
 
 
 class BaseExtractor(ABC):
@@ -25,17 +30,19 @@ class BaseExtractor(ABC):
         """
         pass
     
-    def preprocess_text(self, text: str) -> str:
+    def preprocess_text(self, text: Union[str, bytes]) -> str:
         """
         Preprocess text before extraction.
         
         Args:
-            text: Raw text
+            text: Raw text, or raw UTF-8 bytes (e.g. an HTTP response body)
         
         Returns:
             Preprocessed text
         """
-        # Remove extra whitespace
-        text = ' '.join(text.split())
+        if isinstance(text, bytes):
+            # Normalize on bytes, then decode once
+            return _WHITESPACE_BYTES_RE.sub(b' ', text).strip().decode('utf-8', 'replace')
         
-        return text
+        # Collapse runs of whitespace (no intermediate token list)
+        return _WHITESPACE_RE.sub(' ', text).strip()
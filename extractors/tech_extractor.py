@@ -1,16 +1,31 @@
 """Tech stack extractor using FlashText."""
 
+import functools
+import itertools
 import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Set, Optional
+from typing import FrozenSet, List, Set, Optional, Union
 import re
+import sys
 
 from flashtext import KeywordProcessor
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional
+    _json = json
+
 from extractors.base import BaseExtractor
 from utils.logger import get_logger
 
 
+# Every tech term contains at least one ASCII letter
+_HAS_LETTER_RE = re.compile(r'[A-Za-z]')
+
 class TechStackExtractor(BaseExtractor):
     """
     Extract tech stack (languages, frameworks, tools) from job descriptions.
@@ -19,6 +34,22 @@ class TechStackExtractor(BaseExtractor):
     Handles edge cases like C#, .NET, C++, etc.
     """
     
+    # Max number of distinct texts kept in the extract() result cache
+    CACHE_SIZE = 4096
+    
+    # Min number of distinct texts for extract_batch() to use a process pool
+    PARALLEL_MIN_TEXTS = 1000
+    
+    # Map special-case regex group names to canonical names
+    _SPECIAL_MAPPINGS = {
+        'csharp': 'C#',
+        'cplusplus': 'C++',
+        'dotnet': '.NET',
+        'fsharp': 'F#',
+        'nodejs': 'Node.js',
+        'vuejs': 'Vue.js',
+    }
+    
     def __init__(self, tech_dictionary_path: Optional[str] = None):
         """
         Initialize tech stack extractor.
@@ -28,11 +59,25 @@ class TechStackExtractor(BaseExtractor):
         """
         self.logger = get_logger("extractor.tech")
         
+        # As passed (None = default), so pool workers can rebuild the extractor
+        self.tech_dictionary_path = tech_dictionary_path
+        
         # Load tech dictionary
         if tech_dictionary_path is None:
             tech_dictionary_path = Path(__file__).parent.parent / "config" / "tech_dictionary.json"
         
-        self.tech_dict = self._load_tech_dictionary(tech_dictionary_path)
+        # Category names and terms are interned: they are used as dict keys
+        # and returned in results for every job
+        self.tech_dict = {
+            sys.intern(category): [sys.intern(term) for term in terms]
+            for category, terms in self._load_tech_dictionary(tech_dictionary_path).items()
+        }
+        
+        # Lowercase term -> category lookup (first category listing a term wins)
+        self._term_to_category = {}
+        for category, terms in self.tech_dict.items():
+            for term in terms:
+                self._term_to_category.setdefault(term.lower(), category)
         
         # Initialize FlashText processor
         self.keyword_processor = KeywordProcessor(case_sensitive=False)
@@ -40,8 +85,16 @@ class TechStackExtractor(BaseExtractor):
         # Add keywords from dictionary
         self._build_keyword_processor()
         
-        # Regex patterns for special cases
+        # Combined regex for special cases
         self._special_patterns = self._build_special_patterns()
+        
+        # LRU cache of preprocessed text -> extracted terms (syndicated
+        # postings repeat the same description across sources)
+        self._cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        
+        # extract_batch() process pool, started on first use and reused
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
     
     def _load_tech_dictionary(self, path: Path) -> dict:
         """
@@ -54,8 +107,7 @@ class TechStackExtractor(BaseExtractor):
             Tech dictionary
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json.loads(Path(path).read_bytes())
         except Exception as e:
             self.logger.error(f"Failed to load tech dictionary from {path}: {e}")
             return {
@@ -69,39 +121,40 @@ class TechStackExtractor(BaseExtractor):
     
     def _build_keyword_processor(self):
         """Build FlashText keyword processor from tech dictionary."""
-        # Add all tech terms to processor
-        for category, terms in self.tech_dict.items():
-            for term in terms:
-                # Add term and common variations
-                self.keyword_processor.add_keyword(term, term)
-                
-                # Add case variations for better matching
-                if term.lower() != term:
-                    self.keyword_processor.add_keyword(term.lower(), term)
-                if term.upper() != term:
-                    self.keyword_processor.add_keyword(term.upper(), term)
+        # Add all tech terms to processor (term -> canonical term).
+        # The processor is case-insensitive and lowercases keywords itself,
+        # so no separate lower/upper case variants are needed.
+        self.keyword_processor.add_keywords_from_dict({
+            term: [term]
+            for terms in self.tech_dict.values()
+            for term in terms
+        })
     
-    def _build_special_patterns(self) -> dict:
+    def _build_special_patterns(self) -> re.Pattern:
         """
-        Build regex patterns for special cases.
+        Build regex for special cases.
+        
+        All special cases are combined into a single alternation of named
+        groups so the text is scanned once instead of once per pattern.
         
         Returns:
-            Dict of pattern name -> compiled regex
+            Compiled regex (group name -> canonical name via _SPECIAL_MAPPINGS)
         """
-        return {
+        return re.compile(
             # C# with optional space
-            'csharp': re.compile(r'\bC\s*#\b', re.IGNORECASE),
+            r'(?P<csharp>\bC\s*#\b)'
             # C++ with optional space
-            'cplusplus': re.compile(r'\bC\s*\+\+\b', re.IGNORECASE),
+            r'|(?P<cplusplus>\bC\s*\+\+\b)'
             # .NET variants
-            'dotnet': re.compile(r'\.NET(?:\s+Core|\s+Framework|\s+\d+)?', re.IGNORECASE),
-            # F# 
-            'fsharp': re.compile(r'\bF\s*#\b', re.IGNORECASE),
+            r'|(?P<dotnet>\.NET(?:\s+Core|\s+Framework|\s+\d+)?)'
+            # F#
+            r'|(?P<fsharp>\bF\s*#\b)'
             # Node.js variants (including NodeJS written as one word)
-            'nodejs': re.compile(r'\b(?:Node(?:\.js)?|NodeJS)\b', re.IGNORECASE),
+            r'|(?P<nodejs>\b(?:Node(?:\.js)?|NodeJS)\b)'
             # Vue.js variants
-            'vuejs': re.compile(r'\bVue(?:\.js)?\b', re.IGNORECASE),
-        }
+            r'|(?P<vuejs>\bVue(?:\.js)?\b)',
+            re.IGNORECASE,
+        )
     
     def _extract_special_cases(self, text: str) -> Set[str]:
         """
@@ -113,42 +166,44 @@ class TechStackExtractor(BaseExtractor):
         Returns:
             Set of extracted special tech terms
         """
-        found = set()
+        # Cheap substring checks: every special case needs one of these
+        if '#' not in text and '+' not in text and '.' not in text:
+            lowered = text.lower()
+            if 'node' not in lowered and 'vue' not in lowered:
+                return set()
         
-        # Map pattern matches to canonical names
-        special_mappings = {
-            'csharp': 'C#',
-            'cplusplus': 'C++',
-            'dotnet': '.NET',
-            'fsharp': 'F#',
-            'nodejs': 'Node.js',
-            'vuejs': 'Vue.js',
+        return {
+            self._SPECIAL_MAPPINGS[match.lastgroup]
+            for match in self._special_patterns.finditer(text)
         }
-        
-        for pattern_name, pattern in self._special_patterns.items():
-            if pattern.search(text):
-                canonical_name = special_mappings.get(pattern_name)
-                if canonical_name:
-                    found.add(canonical_name)
-        
-        return found
     
-    def extract(self, text: str) -> Set[str]:
+    def extract(self, text: Union[str, bytes]) -> FrozenSet[str]:
         """
         Extract tech stack from text.
         
+        Results are memoized per text (LRU, CACHE_SIZE entries), so the
+        returned set is immutable.
+        
         Args:
-            text: Job description or any text
+            text: Job description or any text (raw UTF-8 bytes accepted)
         
         Returns:
-            Set of tech terms found
+            Frozenset of tech terms found
         """
         if not text:
-            return set()
+            return frozenset()
         
-        # Preprocess text
+        # Preprocess text (also decodes bytes)
         text = self.preprocess_text(text)
         
+        if not _HAS_LETTER_RE.search(text):
+            return frozenset()
+        
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+        
         # Extract using FlashText
         flashtext_results = set(self.keyword_processor.extract_keywords(text))
         
@@ -156,12 +211,85 @@ class TechStackExtractor(BaseExtractor):
         special_results = self._extract_special_cases(text)
         
         # Combine results
-        all_results = flashtext_results | special_results
+        all_results = frozenset(flashtext_results | special_results)
+        
+        self.logger.debug("Extracted %d tech terms: %s", len(all_results), all_results)
         
-        self.logger.debug(f"Extracted {len(all_results)} tech terms: {all_results}")
+        self._cache[text] = all_results
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
         
         return all_results
     
+    def extract_batch(
+        self,
+        texts: List[Union[str, bytes]],
+        processes: Optional[int] = None
+    ) -> List[FrozenSet[str]]:
+        """
+        Extract tech stack from many texts.
+        
+        Identical texts in the batch are scanned once. With processes > 1
+        and at least PARALLEL_MIN_TEXTS distinct texts, scanning is spread
+        over a process pool (each worker builds its own shared extractor);
+        smaller batches are not worth the pool startup. The pool is kept
+        and reused by later batches until close().
+        
+        Args:
+            texts: Job descriptions or any texts
+            processes: Max worker processes (None/1 = extract in this process)
+        
+        Returns:
+            Frozenset of tech terms per text, in input order
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        
+        if processes and processes > 1 and len(unique_texts) >= self.PARALLEL_MIN_TEXTS:
+            try:
+                extracted = self._get_executor(processes).map(
+                    _extract_with_shared,
+                    itertools.repeat(self.tech_dictionary_path),
+                    unique_texts,
+                    chunksize=64
+                )
+                results = dict(zip(unique_texts, extracted))
+            except BrokenProcessPool:
+                # Start a new pool on the next batch
+                self.close()
+                raise
+        else:
+            extract = self.extract
+            results = {text: extract(text) for text in unique_texts}
+        
+        return [results[text] for text in texts]
+    
+    def _get_executor(self, processes: int) -> ProcessPoolExecutor:
+        """
+        Get the extract_batch() process pool, (re)starting it if needed.
+        
+        Args:
+            processes: Number of worker processes
+        
+        Returns:
+            ProcessPoolExecutor with that many workers
+        """
+        if self._executor is None or self._executor_workers != processes:
+            self.close()
+            # spawn: callers may run this from a worker thread, where fork is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            self._executor_workers = processes
+        return self._executor
+    
+    def close(self):
+        """Shut down the extract_batch() process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+    
     def extract_by_category(self, text: str) -> dict:
         """
         Extract tech stack grouped by category.
@@ -170,7 +298,7 @@ class TechStackExtractor(BaseExtractor):
             text: Job description or any text
         
         Returns:
-            Dict of category -> set of tech terms
+            Dict of category -> frozenset of tech terms
         """
         all_tech = self.extract(text)
         
@@ -178,18 +306,32 @@ class TechStackExtractor(BaseExtractor):
         categorized = {category: set() for category in self.tech_dict.keys()}
         categorized["other"] = set()  # Add 'other' for uncategorized terms
         
-        # Categorize found tech terms
+        # Categorize found tech terms (case-insensitive lookup)
         for tech in all_tech:
-            found_category = False
-            for category, terms in self.tech_dict.items():
-                # Case-insensitive match
-                if any(tech.lower() == term.lower() for term in terms):
-                    categorized[category].add(tech)
-                    found_category = True
-                    break
-            
-            if not found_category:
-                categorized["other"].add(tech)
+            category = self._term_to_category.get(tech.lower(), "other")
+            categorized[category].add(tech)
         
         # Remove empty categories
-        return {k: v for k, v in categorized.items() if v}
+        return {k: frozenset(v) for k, v in categorized.items() if v}
+
+
+@functools.lru_cache(maxsize=4)
+def get_tech_extractor(tech_dictionary_path: Optional[str] = None) -> TechStackExtractor:
+    """
+    Get shared TechStackExtractor instance (one per dictionary path).
+    
+    Building the FlashText keyword trie is the expensive part of the
+    extractor, so it is done once per process instead of per caller.
+    
+    Args:
+        tech_dictionary_path: Path to tech_dictionary.json (optional)
+    
+    Returns:
+        TechStackExtractor instance
+    """
+    return TechStackExtractor(tech_dictionary_path)
+
+
+def _extract_with_shared(tech_dictionary_path: Optional[str], text: Union[str, bytes]) -> FrozenSet[str]:
+    """Process pool worker: extract with this process's shared extractor."""
+    return get_tech_extractor(tech_dictionary_path).extract(text)
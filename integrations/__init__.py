@@ -5,6 +5,12 @@ Modules:
 - google_sheets: Google Sheets API integration
 """
 
-from integrations.google_sheets import GoogleSheetsWriter
-
 __all__ = ['GoogleSheetsWriter']
+
+
+def __getattr__(name):
+    # Import lazily: gspread/google-auth are only needed when exporting
+    if name == 'GoogleSheetsWriter':
+        from integrations.google_sheets import GoogleSheetsWriter
+        return GoogleSheetsWriter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,19 @@ Uses gspread library with Google Service Account authentication.
 """
 
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from pathlib import Path
 import json
 
 import gspread
 from google.oauth2.service_account import Credentials
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional
+    _json = json
+
 from models.job import Job, ScoreResult
 from utils.logger import get_logger
 
@@ -77,6 +83,10 @@ class GoogleSheetsWriter:
         self.credentials_path = credentials_path
         self.spreadsheet_name = spreadsheet_name or "Job_finder_results"
         
+        # Resolved handles (avoid Drive/metadata lookups on every write)
+        self._spreadsheet: Optional[gspread.Spreadsheet] = None
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+        
         # Check if credentials exist
         if not os.path.exists(credentials_path):
             self.logger.warning(
@@ -89,9 +99,10 @@ class GoogleSheetsWriter:
             return
         
         try:
-            # Authenticate with service account
-            creds = Credentials.from_service_account_file(
-                credentials_path,
+            # Authenticate with service account (key file parsed with orjson
+            # when available)
+            creds = Credentials.from_service_account_info(
+                _json.loads(Path(credentials_path).read_bytes()),
                 scopes=self.SCOPES
             )
             
@@ -108,6 +119,11 @@ class GoogleSheetsWriter:
         """Check if Google Sheets integration is enabled."""
         return self.enabled
     
+    def refresh(self):
+        """Forget cached spreadsheet/worksheet handles (re-resolved on next write)."""
+        self._spreadsheet = None
+        self._worksheets.clear()
+    
     def write_jobs(
         self,
         jobs: List[Job],
@@ -117,6 +133,11 @@ class GoogleSheetsWriter:
         """
         Write jobs to Google Sheets.
         
+        Values go out in one spreadsheets.batchUpdate request and header/
+        color formatting in a second one, whose failure only logs a
+        warning; only resolving the spreadsheet/worksheet (cached per
+        writer) adds API calls.
+        
         Args:
             jobs: List of Job objects to write
             scores: Optional dict mapping job IDs to ScoreResult objects
@@ -144,39 +165,35 @@ class GoogleSheetsWriter:
             # Create or get worksheet
             worksheet = self._get_or_create_worksheet(spreadsheet, sheet_name)
             
-            # Clear existing data
-            worksheet.clear()
+            # Write header + job data in a single batch_update round-trip
+            payload = [self.HEADERS] + self._jobs_to_rows(jobs, scores)
+            spreadsheet.batch_update({'requests': self._write_requests(worksheet, payload)})
             
-            # Write header
-            worksheet.append_row(self.HEADERS)
+            # appendDimension grew the grid behind the cached handle's back;
+            # re-fetch it on the next write so row_count is current
+            if len(payload) > worksheet.row_count:
+                self._worksheets.pop(sheet_name, None)
             
-            # Format header (bold, freeze)
-            self._format_header(worksheet)
-            
-            # Write job data
-            rows = []
-            for job in jobs:
-                row = self._job_to_row(job, scores)
-                rows.append(row)
-            
-            # Batch write rows (more efficient than append_row in loop)
-            if rows:
-                worksheet.append_rows(rows)
-            
-            # Apply formatting
-            self._apply_formatting(worksheet, len(jobs), scores)
+            # Header and color formatting (best effort, in one more round-trip)
+            try:
+                spreadsheet.batch_update({'requests': (
+                    self._header_requests(worksheet)
+                    + self._formatting_requests(worksheet, jobs, scores)
+                )})
+            except Exception as e:
+                self.logger.warning(f"Failed to apply formatting: {e}")
             
             # Get sheet URL
             sheet_url = spreadsheet.url
             
             self.logger.info(
-                f"Successfully wrote {len(jobs)} jobs to Google Sheets: {sheet_url}"
+                "Successfully wrote %d jobs to Google Sheets: %s", len(jobs), sheet_url
             )
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to write jobs to Google Sheets: {e}", exc_info=True)
+            self.logger.error("Failed to write jobs to Google Sheets: %s", e, exc_info=True)
             return False
     
     def _get_or_create_spreadsheet(self) -> gspread.Spreadsheet:
@@ -187,6 +204,19 @@ class GoogleSheetsWriter:
         when available, which is more reliable than searching by name across
         all sheets the service account can see.
         
+        Cached after the first call; see refresh().
+        
+        Returns:
+            Spreadsheet object
+        """
+        if self._spreadsheet is None:
+            self._spreadsheet = self._open_or_create_spreadsheet()
+        return self._spreadsheet
+    
+    def _open_or_create_spreadsheet(self) -> gspread.Spreadsheet:
+        """
+        Open spreadsheet by ID or name, creating it if not found.
+        
         Returns:
             Spreadsheet object
         """
@@ -235,6 +265,29 @@ class GoogleSheetsWriter:
         """
         Get or create worksheet in spreadsheet.
         
+        Cached per sheet name after the first call; see refresh().
+        
+        Args:
+            spreadsheet: Spreadsheet object
+            sheet_name: Name of worksheet
+        
+        Returns:
+            Worksheet object
+        """
+        worksheet = self._worksheets.get(sheet_name)
+        if worksheet is None:
+            worksheet = self._open_or_create_worksheet(spreadsheet, sheet_name)
+            self._worksheets[sheet_name] = worksheet
+        return worksheet
+    
+    def _open_or_create_worksheet(
+        self,
+        spreadsheet: gspread.Spreadsheet,
+        sheet_name: str
+    ) -> gspread.Worksheet:
+        """
+        Open worksheet by name, creating it if not found.
+        
         Args:
             spreadsheet: Spreadsheet object
             sheet_name: Name of worksheet
@@ -261,7 +314,8 @@ class GoogleSheetsWriter:
     def _job_to_row(
         self,
         job: Job,
-        scores: Optional[Dict[str, ScoreResult]] = None
+        scores: Optional[Dict[str, ScoreResult]] = None,
+        score_cells: Optional[Tuple[str, str]] = None
     ) -> List[str]:
         """
         Convert Job object to spreadsheet row.
@@ -269,24 +323,19 @@ class GoogleSheetsWriter:
         Args:
             job: Job object
             scores: Optional dict mapping job IDs to ScoreResult objects
+            score_cells: Optional precomputed (score, breakdown) cells;
+                         built from scores when omitted
         
         Returns:
             List of strings for row
         """
         # Get score data
-        score = None
-        breakdown = ""
-        
-        if scores and job.id in scores:
-            score_result = scores[job.id]
-            score = score_result.score
-            
-            # Format breakdown
-            components = []
-            for comp_name, comp_data in score_result.breakdown.items():
-                normalized = comp_data.get('normalized', 0.0)
-                components.append(f"{comp_name}:{normalized:.1f}")
-            breakdown = ", ".join(components)
+        if score_cells is None:
+            if scores and job.id in scores:
+                score_cells = self._score_cells(scores[job.id])
+            else:
+                score_cells = ("", "")
+        score, breakdown = score_cells
         
         # Format tech stack
         tech_stack = ", ".join(job.tech_stack) if job.tech_stack else ""
@@ -303,7 +352,7 @@ class GoogleSheetsWriter:
             job.remote_type or "",
             job.contract_type or "",
             tech_stack,
-            str(score) if score is not None else "",
+            score,
             breakdown,
             str(job.url),  # Convert HttpUrl to string
             job.source,
@@ -313,76 +362,197 @@ class GoogleSheetsWriter:
         
         return row
     
-    def _format_header(self, worksheet: gspread.Worksheet):
+    @staticmethod
+    def _score_cells(score_result: ScoreResult) -> Tuple[str, str]:
+        """
+        Format score and breakdown cells for a ScoreResult.
+        
+        Args:
+            score_result: ScoreResult object
+        
+        Returns:
+            Tuple of (score, breakdown) strings
+        """
+        breakdown = ", ".join(
+            f"{comp_name}:{comp_data.get('normalized', 0.0):.1f}"
+            for comp_name, comp_data in score_result.breakdown.items()
+        )
+        return str(score_result.score), breakdown
+    
+    def _jobs_to_rows(
+        self,
+        jobs: List[Job],
+        scores: Optional[Dict[str, ScoreResult]] = None
+    ) -> List[List[str]]:
+        """
+        Convert Job objects to spreadsheet rows in one pass.
+        
+        Calls _job_to_row() per job, with the score and breakdown cells
+        formatted once per ScoreResult up front.
+        
+        Args:
+            jobs: Job objects
+            scores: Optional dict mapping job IDs to ScoreResult objects
+        
+        Returns:
+            List of rows (lists of strings)
+        """
+        score_cells = {
+            job_id: self._score_cells(result)
+            for job_id, result in (scores or {}).items()
+        }
+        no_score = ("", "")
+        
+        return [
+            self._job_to_row(job, score_cells=score_cells.get(job.id, no_score))
+            for job in jobs
+        ]
+    
+    def _write_requests(
+        self,
+        worksheet: gspread.Worksheet,
+        payload: List[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build batch_update requests writing rows from A1.
+        
+        Values are written as plain strings (like a RAW values update).
+        Rows below the payload are emptied so a shorter re-run leaves no
+        stale jobs behind.
+        
+        Args:
+            worksheet: Worksheet object
+            payload: Rows to write (header first)
+        
+        Returns:
+            List of request dicts
+        """
+        requests = []
+        
+        # Grow the grid if needed
+        if len(payload) > worksheet.row_count:
+            requests.append({
+                'appendDimension': {
+                    'sheetId': worksheet.id,
+                    'dimension': 'ROWS',
+                    'length': len(payload) - worksheet.row_count
+                }
+            })
+        
+        requests.append({
+            'updateCells': {
+                'start': {'sheetId': worksheet.id, 'rowIndex': 0, 'columnIndex': 0},
+                'rows': [
+                    {'values': [{'userEnteredValue': {'stringValue': value}} for value in row]}
+                    for row in payload
+                ],
+                'fields': 'userEnteredValue'
+            }
+        })
+        
+        # Clear rows left over from a previous, longer write
+        if worksheet.row_count > len(payload):
+            requests.append({
+                'updateCells': {
+                    'range': {
+                        'sheetId': worksheet.id,
+                        'startRowIndex': len(payload),
+                        'endRowIndex': worksheet.row_count,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': len(self.HEADERS)
+                    },
+                    'fields': 'userEnteredValue'
+                }
+            })
+        
+        return requests
+    
+    def _header_requests(self, worksheet: gspread.Worksheet) -> List[Dict[str, Any]]:
         """
-        Format header row (bold, freeze).
+        Build batch_update requests formatting the header row (bold, freeze).
         
         Args:
             worksheet: Worksheet object
+        
+        Returns:
+            List of request dicts
         """
-        try:
+        return [
             # Bold header
-            worksheet.format('A1:M1', {
-                'textFormat': {'bold': True},
-                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-            })
-            
+            {
+                'repeatCell': {
+                    'range': {
+                        'sheetId': worksheet.id,
+                        'startRowIndex': 0,
+                        'endRowIndex': 1,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': len(self.HEADERS)
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'textFormat': {'bold': True},
+                            'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+                        }
+                    },
+                    'fields': 'userEnteredFormat(textFormat,backgroundColor)'
+                }
+            },
             # Freeze header row
-            worksheet.freeze(rows=1)
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to format header: {e}")
+            {
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': worksheet.id,
+                        'gridProperties': {'frozenRowCount': 1}
+                    },
+                    'fields': 'gridProperties.frozenRowCount'
+                }
+            }
+        ]
     
-    def _apply_formatting(
+    def _formatting_requests(
         self,
         worksheet: gspread.Worksheet,
-        num_jobs: int,
+        jobs: List[Job],
         scores: Optional[Dict[str, ScoreResult]] = None
-    ):
+    ) -> List[Dict[str, Any]]:
         """
-        Apply formatting to worksheet.
+        Build batch_update requests for row colors and column widths.
         
         Args:
             worksheet: Worksheet object
-            num_jobs: Number of jobs written
+            jobs: Jobs written (in row order, starting at row 2)
             scores: Optional dict mapping job IDs to ScoreResult objects
+        
+        Returns:
+            List of request dicts
         """
-        if num_jobs == 0:
-            return
+        # Color code rows based on score (column H).
+        # Scores are taken from memory instead of reading the column
+        # back cell by cell (one API call per row).
+        scores = scores or {}
+        score_column = [
+            scores[job.id].score if job.id in scores else None
+            for job in jobs
+        ]
         
-        try:
-            # Color code rows based on score (column H)
-            # We need to get all scores first
-            score_column = []
-            for i in range(2, num_jobs + 2):  # Starting from row 2 (after header)
-                cell_value = worksheet.cell(i, 8).value  # Column H (Score)
-                try:
-                    score = float(cell_value) if cell_value else None
-                except:
-                    score = None
-                score_column.append(score)
-            
-            # Apply color coding
-            for i, score in enumerate(score_column, start=2):
-                if score is None:
-                    continue
-                
-                color = self._get_color_for_score(score)
-                
-                # Format entire row
-                row_range = f'A{i}:M{i}'
-                worksheet.format(row_range, {
-                    'backgroundColor': color
-                })
-            
-            # Auto-resize columns
-            self._auto_resize_columns(worksheet)
-            
-            # Make URLs clickable (they're already clickable in Google Sheets)
-            # Just ensure column J has proper width
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to apply formatting: {e}")
+        # One request per run of adjacent rows sharing a color
+        requests = []
+        run_start = None
+        run_color = None
+        for i, score in enumerate(score_column + [None], start=2):
+            color = self._get_color_for_score(score) if score is not None else None
+            if color == run_color:
+                continue
+            if run_color is not None:
+                requests.append(
+                    self._row_color_request(worksheet, run_start, i - 1, run_color)
+                )
+            run_start, run_color = i, color
+        
+        # Set column widths
+        requests.extend(self._column_width_requests(worksheet))
+        
+        return requests
     
     def _get_color_for_score(self, score: float) -> Dict[str, float]:
         """
@@ -404,53 +574,84 @@ class GoogleSheetsWriter:
             # White
             return {'red': 1.0, 'green': 1.0, 'blue': 1.0}
     
-    def _auto_resize_columns(self, worksheet: gspread.Worksheet):
+    def _row_color_request(
+        self,
+        worksheet: gspread.Worksheet,
+        first_row: int,
+        last_row: int,
+        color: Dict[str, float]
+    ) -> Dict[str, Any]:
         """
-        Auto-resize columns to fit content.
+        Build batch_update request setting the background of a row range.
         
         Args:
             worksheet: Worksheet object
+            first_row: First row to color (1-based, inclusive)
+            last_row: Last row to color (1-based, inclusive)
+            color: Dict with RGB values (0-1)
+        
+        Returns:
+            repeatCell request dict
         """
-        try:
-            # Set column widths (approximate based on content)
-            column_widths = {
-                'A': 120,   # Date Found
-                'B': 250,   # Title
-                'C': 150,   # Company
-                'D': 150,   # Location
-                'E': 100,   # Remote
-                'F': 120,   # Contract
-                'G': 200,   # Tech Stack
-                'H': 70,    # Score
-                'I': 200,   # Breakdown
-                'J': 300,   # URL
-                'K': 100,   # Source
-                'L': 80,    # Applied?
-                'M': 200    # Notes
+        return {
+            'repeatCell': {
+                'range': {
+                    'sheetId': worksheet.id,
+                    'startRowIndex': first_row - 1,
+                    'endRowIndex': last_row,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': len(self.HEADERS)
+                },
+                'cell': {
+                    'userEnteredFormat': {'backgroundColor': color}
+                },
+                'fields': 'userEnteredFormat.backgroundColor'
             }
-            
-            # Apply column widths
-            requests = []
-            for col_letter, width in column_widths.items():
-                col_index = ord(col_letter) - ord('A')
-                requests.append({
-                    'updateDimensionProperties': {
-                        'range': {
-                            'sheetId': worksheet.id,
-                            'dimension': 'COLUMNS',
-                            'startIndex': col_index,
-                            'endIndex': col_index + 1
-                        },
-                        'properties': {
-                            'pixelSize': width
-                        },
-                        'fields': 'pixelSize'
-                    }
-                })
-            
-            # Batch update
-            if requests:
-                worksheet.spreadsheet.batch_update({'requests': requests})
-                
-        except Exception as e:
-            self.logger.warning(f"Failed to auto-resize columns: {e}")
+        }
+    
+    def _column_width_requests(self, worksheet: gspread.Worksheet) -> List[Dict[str, Any]]:
+        """
+        Build batch_update requests sizing columns to fit content.
+        
+        Args:
+            worksheet: Worksheet object
+        
+        Returns:
+            List of updateDimensionProperties request dicts
+        """
+        # Set column widths (approximate based on content)
+        column_widths = {
+            'A': 120,   # Date Found
+            'B': 250,   # Title
+            'C': 150,   # Company
+            'D': 150,   # Location
+            'E': 100,   # Remote
+            'F': 120,   # Contract
+            'G': 200,   # Tech Stack
+            'H': 70,    # Score
+            'I': 200,   # Breakdown
+            'J': 300,   # URL
+            'K': 100,   # Source
+            'L': 80,    # Applied?
+            'M': 200    # Notes
+        }
+        
+        requests = []
+        for col_letter, width in column_widths.items():
+            col_index = ord(col_letter) - ord('A')
+            requests.append({
+                'updateDimensionProperties': {
+                    'range': {
+                        'sheetId': worksheet.id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': col_index,
+                        'endIndex': col_index + 1
+                    },
+                    'properties': {
+                        'pixelSize': width
+                    },
+                    'fields': 'pixelSize'
+                }
+            })
+        
+        return requests
@@ -2,15 +2,24 @@
 
 import asyncio
 import argparse
+import functools
+import heapq
 import json
 import sys
 import os
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 
 # Ensure project root is in sys.path (needed for GitHub Actions / non-installed runs)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from typing import List, Optional
+
+# Skip Pydantic's internal core-schema self-check on model class creation (startup cost)
+os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
+
+from typing import List, Optional, Set
+
+import httpx
 
 from models.job import Job
 from config.settings import Settings
@@ -20,14 +29,33 @@ from scrapers.hackernews import HackerNewsScraper
 from scrapers.adzuna import AdzunaScraper
 from scrapers.stepstone import StepStoneScraper
 from scrapers.xing import XINGScraper
-from extractors.tech_extractor import TechStackExtractor
+from extractors.tech_extractor import get_tech_extractor
 from processors.filter import JobFilter
 from processors.deduplicator import Deduplicator
 from scorers.aggregator import ScoreAggregator
-from integrations.google_sheets import GoogleSheetsWriter
 from utils.logger import get_logger, setup_logging
 
 
+@functools.lru_cache(maxsize=None)
+def _remote_priority(remote_type: str) -> int:
+    """
+    Get remote priority for a remote type (higher = better).
+    
+    Cached: remote types come from a small vocabulary.
+    """
+    remote_type = remote_type.lower()
+    
+    # Full Remote: highest priority
+    if any(kw in remote_type for kw in ('remote', '100%', 'homeoffice', 'fully')):
+        return 3
+    # Hybrid: medium priority
+    elif 'hybrid' in remote_type:
+        return 2
+    # Onsite: lowest priority
+    else:
+        return 1
+
+
 class JobFinderPipeline:
     """
     Main pipeline for scraping, filtering, and scoring jobs.
@@ -43,10 +71,17 @@ class JobFinderPipeline:
         'xing': XINGScraper,
     }
     
+    # Max scrapers fetching at the same time
+    MAX_CONCURRENT_SCRAPERS = 6
+    
+    # Lifetime of cached scraper results (--cache-scrapes)
+    SCRAPE_CACHE_TTL_HOURS = 1
+    
     def __init__(
         self,
         scrapers: Optional[List[str]] = None,
-        dev_mode: bool = False
+        dev_mode: bool = False,
+        cache_scrapes: bool = False
     ):
         """
         Initialize pipeline.
@@ -54,6 +89,8 @@ class JobFinderPipeline:
         Args:
             scrapers: List of scraper names to use (default: all)
             dev_mode: If True, enables development mode (verbose logging)
+            cache_scrapes: If True, reuse each scraper's results from disk
+                           for SCRAPE_CACHE_TTL_HOURS (for tuning runs)
         """
         self.logger = get_logger("pipeline")
         self.settings = Settings()
@@ -62,6 +99,7 @@ class JobFinderPipeline:
         # Load profile
         self.profile = self.settings.load_profile()
         self.logger.info(f"Loaded profile: {self.profile.name}")
+        self._locations = tuple(self.profile.preferences.get('locations', []))
         
         # Initialize scrapers
         if scrapers:
@@ -79,10 +117,22 @@ class JobFinderPipeline:
         )
         
         # Initialize processors
-        self.tech_extractor = TechStackExtractor()
+        self.tech_extractor = get_tech_extractor()
         self.job_filter = JobFilter()
         self.deduplicator = Deduplicator()
         self.scorer = ScoreAggregator()
+        
+        # IDs of jobs whose tech stack was already extracted this run
+        self._tech_extracted_ids: Set[str] = set()
+        
+        # Optional on-disk cache of scraped jobs
+        self.scrape_cache = None
+        if cache_scrapes:
+            from cache.manager import CacheManager
+            self.scrape_cache = CacheManager(
+                cache_dir=str(self.settings.project_root / self.settings.cache_dir / "scrapes"),
+                ttl_hours=self.SCRAPE_CACHE_TTL_HOURS
+            )
     
     async def run(
         self,
@@ -101,6 +151,7 @@ class JobFinderPipeline:
         """
         start_time = datetime.now()
         self.logger.info(f"Starting job scraper at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        self._tech_extracted_ids.clear()
         
         # Step 1: Scrape jobs from all sources
         all_jobs = await self._scrape_jobs(keywords)
@@ -109,7 +160,8 @@ class JobFinderPipeline:
             self.logger.warning("No jobs found after scraping")
             return []
         
-        # Step 2: Extract tech stack
+        # Step 2: Extract tech stack (no-op for jobs already handled while
+        # scraping)
         jobs_with_tech = self._extract_tech_stack(all_jobs)
         
         # Step 3: Deduplicate
@@ -140,29 +192,88 @@ class JobFinderPipeline:
     
     async def _scrape_jobs(self, keywords: Optional[List[str]] = None) -> List[Job]:
         """Scrape jobs from all configured scrapers."""
-        self.logger.info(f"Scraping jobs from {len(self.scrapers)} sources...")
+        self.logger.info("Scraping jobs from %d sources...", len(self.scrapers))
         
         all_jobs = []
         
-        # Run scrapers in parallel
-        tasks = [
-            scraper.fetch_jobs(keywords=keywords)
-            for scraper in self.scrapers
-        ]
+        # Run scrapers in parallel (bounded), sharing one connection pool
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SCRAPERS)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        cache_suffix = "|".join(sorted(keywords or []))
         
-        # Collect results
-        for scraper, result in zip(self.scrapers, results):
-            if isinstance(result, Exception):
-                self.logger.error(f"Scraper {scraper.name} failed: {result}")
-                continue
+        async def run_scraper(scraper):
+            cache_key = f"scrape:{scraper.name}:{cache_suffix}"
+            if self.scrape_cache is not None:
+                cached_jobs = self.scrape_cache.get(cache_key)
+                if cached_jobs is not None:
+                    self.logger.info("Using cached results for %s", scraper.name)
+                    return scraper, cached_jobs
+            
+            async with semaphore:
+                try:
+                    jobs = await scraper.fetch_jobs(keywords=keywords)
+                except Exception as e:
+                    return scraper, e
             
-            jobs = result
-            all_jobs.extend(jobs)
-            self.logger.info(f"Scraping {scraper.name}... Found {len(jobs)} jobs")
+            if self.scrape_cache is not None:
+                self.scrape_cache.set(cache_key, jobs)
+            return scraper, jobs
+        
+        # Extract tech stack in a worker thread while later scrapers still
+        # run (one batch at a time; the extractor is not thread-safe)
+        extract_queue: asyncio.Queue = asyncio.Queue()
+        
+        async def extract_worker():
+            while (jobs := await extract_queue.get()) is not None:
+                await asyncio.to_thread(self._extract_tech_stack, jobs)
+        
+        extractor_task = asyncio.create_task(extract_worker())
+        
+        # Collect results as scrapers finish, dropping exact duplicates
+        # (same job ID) on the way so they skip tech extraction; fuzzy
+        # dedup runs later
+        seen_ids = set()
+        exact_duplicates = 0
+        
+        scrapers_config = self.settings.get_scrapers_config()
+        async with httpx.AsyncClient(
+            timeout=scrapers_config['timeout'],
+            follow_redirects=True,
+            headers={'User-Agent': scrapers_config['user_agents'][0]},
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+        ) as client:
+            for scraper in self.scrapers:
+                scraper.use_client(client)
+            try:
+                for next_result in asyncio.as_completed(
+                    [run_scraper(scraper) for scraper in self.scrapers]
+                ):
+                    scraper, result = await next_result
+                    if isinstance(result, Exception):
+                        self.logger.error("Scraper %s failed: %s", scraper.name, result)
+                        continue
+                    
+                    new_jobs = []
+                    for job in result:
+                        if job.id in seen_ids:
+                            exact_duplicates += 1
+                            continue
+                        seen_ids.add(job.id)
+                        new_jobs.append(job)
+                    
+                    all_jobs.extend(new_jobs)
+                    extract_queue.put_nowait(new_jobs)
+                    self.logger.info("Scraping %s... Found %d jobs", scraper.name, len(result))
+            finally:
+                for scraper in self.scrapers:
+                    scraper.use_client(None)
+                extract_queue.put_nowait(None)
+                await extractor_task
         
-        self.logger.info(f"Total scraped: {len(all_jobs)} jobs")
+        self.logger.info(
+            "Total scraped: %d jobs (%d exact duplicates skipped)",
+            len(all_jobs), exact_duplicates
+        )
         
         return all_jobs
     
@@ -172,7 +283,7 @@ class JobFinderPipeline:
         criteria = {
             'min_description_length': 50,
             'max_age_days': 14,  # Last 2 weeks
-            'locations': self.profile.preferences.get('locations', []),
+            'locations': self._locations,
             'exclude_senior_lead': True  # Exclude Senior/Lead positions
         }
         
@@ -187,19 +298,27 @@ class JobFinderPipeline:
         return filtered
     
     def _extract_tech_stack(self, jobs: List[Job]) -> List[Job]:
-        """Extract tech stack from job descriptions."""
+        """Extract tech stack from job descriptions (once per job per run)."""
+        pending = [
+            job for job in jobs
+            if job.id not in self._tech_extracted_ids and not job.tech_stack
+        ]
+        if not pending:
+            return jobs
+        
         self.logger.info("Extracting tech stack...")
         
-        for job in jobs:
-            if not job.tech_stack:
-                # Extract tech stack from description
-                tech_stack = self.tech_extractor.extract(
-                    f"{job.title} {job.description}"
-                )
-                if tech_stack:
-                    job.tech_stack = tech_stack
+        # Extract tech stack from descriptions in one batch
+        tech_stacks = self.tech_extractor.extract_batch(
+            [f"{job.title} {job.description}" for job in pending],
+            processes=os.cpu_count()
+        )
+        for job, tech_stack in zip(pending, tech_stacks):
+            if tech_stack:
+                job.tech_stack = tech_stack
+        self._tech_extracted_ids.update(job.id for job in pending)
         
-        self.logger.info(f"Extracting tech stack... Done ({len(jobs)} jobs)")
+        self.logger.info("Extracting tech stack... Done (%d jobs)", len(pending))
         
         return jobs
     
@@ -220,10 +339,10 @@ class JobFinderPipeline:
         """Score all jobs."""
         self.logger.info("Scoring jobs...")
         
-        for job in jobs:
-            result = self.scorer.score_job(job, self.profile)
-            
-            # Attach score to job
+        results = self.scorer.score_jobs(jobs, self.profile)
+        
+        # Attach scores to jobs
+        for job, result in zip(jobs, results):
             job.score_result = result
         
         self.logger.info("Scoring jobs... Done")
@@ -263,42 +382,30 @@ class JobFinderPipeline:
         # Filter by minimum score from profile
         min_score = self.profile.get_min_score()
         
-        # Filter scored jobs
-        scored_jobs = [
-            job for job in jobs
-            if hasattr(job, 'score_result') and job.score_result.score >= min_score
-        ]
-
         # Skip already-exported jobs (cross-run deduplication)
         seen_urls = self._load_seen_urls()
-        if seen_urls:
-            before = len(scored_jobs)
-            scored_jobs = [j for j in scored_jobs if str(j.url) not in seen_urls]
-            skipped = before - len(scored_jobs)
-            if skipped:
-                self.logger.info(f"Skipped {skipped} already-exported jobs (seen in last 30 days)")
-        
-        # Define remote priority (higher = better)
-        def get_remote_priority(job: Job) -> int:
-            remote_type = (job.remote_type or '').lower()
-            
-            # Full Remote: highest priority
-            if any(kw in remote_type for kw in ['remote', '100%', 'homeoffice', 'fully']):
-                return 3
-            # Hybrid: medium priority
-            elif 'hybrid' in remote_type:
-                return 2
-            # Onsite: lowest priority
-            else:
-                return 1
-        
-        # Sort by: 1) Remote priority (desc), 2) Score (desc)
-        scored_jobs.sort(
-            key=lambda j: (get_remote_priority(j), j.score_result.score),
-            reverse=True
-        )
         
-        return scored_jobs[:top_n]
+        # Filter scored jobs above threshold and not yet exported (one pass)
+        scored_jobs = []
+        skipped = 0
+        for job in jobs:
+            if job.score_result is None or job.score_result.score < min_score:
+                continue
+            if seen_urls and str(job.url) in seen_urls:
+                skipped += 1
+                continue
+            scored_jobs.append(job)
+        
+        if skipped:
+            self.logger.info(f"Skipped {skipped} already-exported jobs (seen in last 30 days)")
+        
+        # Top N by: 1) Remote priority (desc), 2) Score (desc).
+        # nlargest keeps a heap of top_n instead of sorting every job.
+        return heapq.nlargest(
+            top_n,
+            scored_jobs,
+            key=lambda j: (_remote_priority(j.remote_type or ''), j.score_result.score)
+        )
     
     def _log_summary(self, top_jobs: List[Job], elapsed_seconds: float, all_scored: Optional[List[Job]] = None):
         """Log pipeline summary."""
@@ -340,7 +447,7 @@ class JobFinderPipeline:
         # Log top jobs
         for i, job in enumerate(top_jobs[:10], 1):
             score = job.score_result.score
-            tech = ', '.join(list(job.tech_stack)[:5]) if job.tech_stack else 'N/A'
+            tech = ', '.join(islice(job.tech_stack, 5)) if job.tech_stack else 'N/A'
             
             self.logger.info(
                 f"  {i}. [{score:.0f}] {job.title} - {job.company} - {tech}"
@@ -386,6 +493,12 @@ async def main():
         help='Enable development mode (verbose logging)'
     )
     
+    parser.add_argument(
+        '--cache-scrapes',
+        action='store_true',
+        help='Reuse scraped jobs cached on disk for up to 1 hour (for tuning runs)'
+    )
+    
     parser.add_argument(
         '--export-sheets',
         action='store_true',
@@ -428,7 +541,8 @@ async def main():
     # Initialize pipeline
     pipeline = JobFinderPipeline(
         scrapers=scrapers,
-        dev_mode=args.dev_mode
+        dev_mode=args.dev_mode,
+        cache_scrapes=args.cache_scrapes
     )
     
     # Run pipeline
@@ -450,7 +564,7 @@ async def main():
             print(f"   Company: {job.company}")
             print(f"   Location: {job.location} ({job.remote_type})")
             if job.tech_stack:
-                print(f"   Tech: {', '.join(list(job.tech_stack)[:8])}")
+                print(f"   Tech: {', '.join(islice(job.tech_stack, 8))}")
             print(f"   URL: {job.url}")
             print()
         
@@ -461,6 +575,9 @@ async def main():
             print(f"{'='*80}\n")
             
             try:
+                # Imported here so runs without --export-sheets skip the Google stack
+                from integrations.google_sheets import GoogleSheetsWriter
+                
                 # Initialize Google Sheets writer
                 writer = GoogleSheetsWriter(spreadsheet_name=args.sheets_name)
                 
@@ -474,8 +591,10 @@ async def main():
                         for job in top_jobs
                     }
                     
-                    # Write to sheets (append mode for local DE runner)
-                    success = writer.write_jobs(
+                    # Write to sheets (append mode for local DE runner).
+                    # gspread is blocking; run it off the event loop.
+                    success = await asyncio.to_thread(
+                        writer.write_jobs,
                         top_jobs,
                         scores_dict,
                         append_mode=args.append_sheets
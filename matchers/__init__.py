@@ -1,5 +1,6 @@
 """Matchers for profile-job similarity."""
 
+from matchers.keyword_matcher import KeywordMatcher
 from matchers.tfidf_matcher import TfidfMatcher
 
-__all__ = ["TfidfMatcher"]
+__all__ = ["KeywordMatcher", "TfidfMatcher"]
@@ -0,0 +1,165 @@
+"""Multi-keyword substring matcher."""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Find which of a fixed set of keywords occur in a text.
+    
+    Keywords are matched as plain substrings, so texts and keywords should
+    be normalized (e.g. lowercased) the same way. With pyahocorasick
+    installed, all keywords are found in a single pass over the text
+    (Aho-Corasick automaton); otherwise each keyword is searched separately.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Initialize keyword matcher.
+        
+        Args:
+            keywords: Keywords to match (order is kept for first())
+        """
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.max_length = max(map(len, self.keywords), default=0)
+        self._rank = {keyword: rank for rank, keyword in enumerate(self.keywords)}
+        
+        # Keyword -> longer keywords containing it (used by find_longest())
+        self._containers: Dict[str, Tuple[str, ...]] = {}
+        for keyword in self.keywords:
+            containers = tuple(
+                other for other in self.keywords
+                if other != keyword and keyword and keyword in other
+            )
+            if containers:
+                self._containers[keyword] = containers
+        
+        self._automaton = None
+        if ahocorasick is not None and self.keywords and all(self.keywords):
+            automaton = ahocorasick.Automaton()
+            # Value is (position in keywords, keyword), so first() can pick
+            # the earliest keyword without another pass over all keywords
+            for index, keyword in enumerate(self.keywords):
+                automaton.add_word(keyword, (index, keyword))
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def find(self, text: str) -> Set[str]:
+        """
+        Find all keywords occurring in text.
+        
+        Args:
+            text: Text to search in
+        
+        Returns:
+            Set of keywords found
+        """
+        if self._automaton is not None:
+            return {keyword for _, (_, keyword) in self._automaton.iter(text)}
+        
+        return {keyword for keyword in self.keywords if keyword in text}
+    
+    def find_longest(self, text: str, found: Optional[Set[str]] = None) -> Set[str]:
+        """
+        Find keywords occurring in text outside longer keyword matches.
+        
+        Like find(), but a keyword whose every occurrence lies inside an
+        occurrence of a longer keyword (e.g. "vor ort" in "3-5 tage vor ort")
+        is not reported, so overlapping rules are not counted twice.
+        
+        Args:
+            text: Text to search in
+            found: Result of find(text), if already known
+        
+        Returns:
+            Set of keywords found
+        """
+        found = self.find(text) if found is None else set(found)
+        
+        for keyword in [keyword for keyword in found if keyword in self._containers]:
+            longer = [other for other in self._containers[keyword] if other in found]
+            if longer and not _has_free_occurrence(text, keyword, longer):
+                found.discard(keyword)
+        
+        return found
+    
+    def first(self, *texts: str) -> Optional[str]:
+        """
+        Find the first keyword (in keyword order) occurring in any text.
+        
+        Args:
+            texts: Texts to search in
+        
+        Returns:
+            Keyword found, or None
+        """
+        if self._automaton is not None:
+            hit = min(
+                (value for text in texts for _, value in self._automaton.iter(text)),
+                default=None
+            )
+            return hit[1] if hit is not None else None
+        
+        return next(
+            (keyword for keyword in self.keywords if any(keyword in text for text in texts)),
+            None
+        )
+    
+    def first_of(self, found: Set[str]) -> Optional[str]:
+        """
+        Get the first keyword (in keyword order) among found keywords.
+        
+        Args:
+            found: Keywords found (e.g. by find())
+        
+        Returns:
+            First keyword, or None if found has none of the keywords
+        """
+        return min(
+            (keyword for keyword in found if keyword in self._rank),
+            key=self._rank.__getitem__,
+            default=None
+        )
+    
+    def search(self, text: str) -> bool:
+        """
+        Check if any keyword occurs in text.
+        
+        Args:
+            text: Text to search in
+        
+        Returns:
+            True if any keyword found
+        """
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        
+        return any(keyword in text for keyword in self.keywords)
+
+
+def _occurrences(text: str, keyword: str) -> List[int]:
+    """Start positions of all (possibly overlapping) occurrences of keyword."""
+    positions = []
+    start = text.find(keyword)
+    while start != -1:
+        positions.append(start)
+        start = text.find(keyword, start + 1)
+    return positions
+
+
+def _has_free_occurrence(text: str, keyword: str, longer: List[str]) -> bool:
+    """Check if keyword occurs in text outside all occurrences of the longer keywords."""
+    spans = [
+        (start, start + len(other))
+        for other in longer
+        for start in _occurrences(text, other)
+    ]
+    return any(
+        not any(span_start <= start and start + len(keyword) <= span_end for span_start, span_end in spans)
+        for start in _occurrences(text, keyword)
+    )
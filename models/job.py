@@ -1,8 +1,8 @@
 """Job data model."""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, HttpUrl, Field, validator
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple
+from pydantic import BaseModel, HttpUrl, Field, PrivateAttr, validator
 import hashlib
 
 
@@ -60,6 +60,11 @@ class Job(BaseModel):
     # Metadata
     scraped_at: datetime = Field(default_factory=datetime.now, description="When job was scraped")
     
+    # Cached (title, description, lowercased text), see get_text_lower()
+    _text_lower: Optional[Tuple[str, str, str]] = PrivateAttr(default=None)
+    # Cached (tech_stack, lowercased tech set), see get_tech_stack_lower()
+    _tech_stack_lower: Optional[Tuple[List[str], FrozenSet[str]]] = PrivateAttr(default=None)
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat(),
@@ -126,6 +131,38 @@ class Job(BaseModel):
                 result.append(term)
         return result
     
+    def get_text_lower(self) -> str:
+        """
+        Get lowercased "title description" text for keyword matching.
+        
+        Cached on the job, so filters and scoring components share one
+        lowercased copy; recomputed if title or description is reassigned.
+        
+        Returns:
+            Lowercased title and description
+        """
+        cached = self._text_lower
+        if cached is None or cached[0] is not self.title or cached[1] is not self.description:
+            cached = (self.title, self.description, f"{self.title} {self.description}".lower())
+            self._text_lower = cached
+        return cached[2]
+    
+    def get_tech_stack_lower(self) -> FrozenSet[str]:
+        """
+        Get lowercased tech stack terms.
+        
+        Cached on the job, so scoring it against several profiles lowercases
+        the terms once; recomputed if tech_stack is reassigned.
+        
+        Returns:
+            Set of lowercased tech terms
+        """
+        cached = self._tech_stack_lower
+        if cached is None or cached[0] is not self.tech_stack:
+            cached = (self.tech_stack, frozenset(t.lower() for t in self.tech_stack))
+            self._tech_stack_lower = cached
+        return cached[1]
+    
     def get_age_days(self) -> int:
         """
         Calculate job age in days.
@@ -1,7 +1,7 @@
 """Profile data model."""
 
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field, validator
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 
 class Skill(BaseModel):
@@ -68,6 +68,9 @@ class Profile(BaseModel):
         description="Detailed CV data for reference"
     )
     
+    # Cached (skills, lowercased skill names), see get_skills_lower()
+    _skills_lower: Optional[Tuple[Dict[str, Any], FrozenSet[str]]] = PrivateAttr(default=None)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -128,6 +131,22 @@ class Profile(BaseModel):
         
         return skills
     
+    def get_skills_lower(self) -> FrozenSet[str]:
+        """
+        Get lowercased names of all skills.
+        
+        Cached on the profile, which is shared by all jobs scored against
+        it; recomputed if skills is reassigned.
+        
+        Returns:
+            Set of lowercased skill names
+        """
+        cached = self._skills_lower
+        if cached is None or cached[0] is not self.skills:
+            cached = (self.skills, frozenset(skill.lower() for skill in self.get_all_skills_flat()))
+            self._skills_lower = cached
+        return cached[1]
+    
     def get_high_proficiency_skills(self, min_level: str = "Advanced") -> List[str]:
         """
         Get skills with high proficiency level.
@@ -182,6 +201,15 @@ class Profile(BaseModel):
         """
         return self.preferences.get('contract_types', [])
     
+    def get_hard_reject_keywords(self) -> List[str]:
+        """
+        Get title keywords that rule a job out before scoring.
+        
+        Returns:
+            List of hard-reject keywords (default: none)
+        """
+        return self.preferences.get('hard_reject_keywords', [])
+    
     def is_remote_preferred(self) -> bool:
         """
         Check if remote work is preferred.
@@ -1,12 +1,90 @@
 """Job deduplication - removes duplicate job postings."""
 
-from typing import List, Set, Tuple, Optional
+import functools
+from typing import Dict, List, Set, Tuple, Optional
 from difflib import SequenceMatcher
 
+import numpy as np
+
 from models.job import Job
 from utils.logger import get_logger
 
 
+def _similarity_upper_bound(text1: str, text2: str) -> float:
+    """
+    Upper bound of SequenceMatcher ratio from string lengths alone.
+    
+    At most min(len) characters can match, so the ratio
+    2 * matches / (len1 + len2) cannot exceed 2 * min(len) / (len1 + len2).
+    
+    Args:
+        text1: First text
+        text2: Second text
+    
+    Returns:
+        Upper bound of similarity (0-1)
+    """
+    total = len(text1) + len(text2)
+    if not total:
+        return 1.0
+    return 2.0 * min(len(text1), len(text2)) / total
+
+
+@functools.lru_cache(maxsize=65536)
+def _sequence_ratio(text1: str, text2: str) -> float:
+    """
+    SequenceMatcher ratio, memoized (company names and titles repeat
+    across many pairs).
+    
+    Args:
+        text1: First text
+        text2: Second text
+    
+    Returns:
+        Similarity score (0-1)
+    """
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
+def _char_counts(texts: List[str]) -> np.ndarray:
+    """
+    Character histograms of texts (characters bucketed by code point % 64).
+    
+    Args:
+        texts: Normalized texts
+    
+    Returns:
+        int32 array of shape (len(texts), 64)
+    """
+    counts = np.zeros((len(texts), 64), dtype=np.int32)
+    for row, text in enumerate(texts):
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32) % 64
+        counts[row] = np.bincount(codes, minlength=64)
+    return counts
+
+
+def _similarity_upper_bounds(counts: np.ndarray, other_counts: np.ndarray) -> np.ndarray:
+    """
+    Upper bound of SequenceMatcher ratio of one text against many.
+    
+    Matching characters can't outnumber the shared characters of the two
+    texts (what SequenceMatcher.quick_ratio counts); merging characters
+    into buckets only raises that count, so the bound stays valid.
+    
+    Args:
+        counts: Character histogram of the first text
+        other_counts: Character histograms of the other texts (one per row)
+    
+    Returns:
+        Upper bound of similarity per other text (0-1)
+    """
+    shared = np.minimum(counts, other_counts).sum(axis=1)
+    totals = counts.sum() + other_counts.sum(axis=1)
+    bounds = np.ones(len(other_counts))
+    np.divide(2.0 * shared, totals, out=bounds, where=totals > 0)
+    return bounds
+
+
 class Deduplicator:
     """
     Remove duplicate job postings based on similarity.
@@ -86,15 +164,12 @@ class Deduplicator:
         Returns:
             List with exact duplicates removed
         """
-        seen_ids: Set[str] = set()
-        unique_jobs = []
-        
+        # Insertion-ordered: first job per ID, in input order
+        unique_jobs: Dict[str, Job] = {}
         for job in jobs:
-            if job.id not in seen_ids:
-                seen_ids.add(job.id)
-                unique_jobs.append(job)
+            unique_jobs.setdefault(job.id, job)
         
-        return unique_jobs
+        return list(unique_jobs.values())
     
     def _remove_similar_duplicates(
         self,
@@ -114,43 +189,30 @@ class Deduplicator:
         unique_jobs = []
         seen_signatures: List[Tuple[str, str]] = []
         
-        for job in jobs:
-            # Create signature from title + company
-            signature = (
-                job.title.lower().strip(),
-                job.company.lower().strip()
-            )
-            
+        for job, signature in zip(jobs, self._signatures(jobs)):
             # Check if similar to any seen signature
             is_duplicate = False
             
-            for seen_sig in seen_signatures:
+            for index in range(len(unique_jobs)):
                 similarity = self._calculate_signature_similarity(
                     signature,
-                    seen_sig
+                    seen_signatures[index],
+                    self.title_company_threshold
                 )
                 
                 if similarity >= self.title_company_threshold:
                     # Potential duplicate - check description if requested
                     if use_description:
-                        # Find the corresponding job for this signature
-                        for unique_job in unique_jobs:
-                            unique_sig = (
-                                unique_job.title.lower().strip(),
-                                unique_job.company.lower().strip()
+                        desc_similarity = self._calculate_text_similarity(
+                            job.description,
+                            unique_jobs[index].description
+                        )
+                        if desc_similarity >= self.description_threshold:
+                            is_duplicate = True
+                            self.logger.debug(
+                                f"Duplicate found: '{job.title}' at {job.company} "
+                                f"(similarity: {similarity:.2f})"
                             )
-                            if unique_sig == seen_sig:
-                                desc_similarity = self._calculate_text_similarity(
-                                    job.description,
-                                    unique_job.description
-                                )
-                                if desc_similarity >= self.description_threshold:
-                                    is_duplicate = True
-                                    self.logger.debug(
-                                        f"Duplicate found: '{job.title}' at {job.company} "
-                                        f"(similarity: {similarity:.2f})"
-                                    )
-                                break
                     else:
                         is_duplicate = True
                         self.logger.debug(
@@ -165,17 +227,37 @@ class Deduplicator:
         
         return unique_jobs
     
+    def _signatures(self, jobs: List[Job]) -> List[Tuple[str, str]]:
+        """
+        Build normalized (title, company) signatures, once per job.
+        
+        Args:
+            jobs: List of jobs
+        
+        Returns:
+            Signature per job, in input order
+        """
+        return [
+            (job.title.lower().strip(), job.company.lower().strip())
+            for job in jobs
+        ]
+    
     def _calculate_signature_similarity(
         self,
         sig1: Tuple[str, str],
-        sig2: Tuple[str, str]
+        sig2: Tuple[str, str],
+        threshold: Optional[float] = None
     ) -> float:
         """
         Calculate similarity between two job signatures.
         
+        With a threshold, pairs whose similarity cannot reach it (judged
+        from string lengths alone) are not compared and score 0.0.
+        
         Args:
             sig1: First signature (title, company)
             sig2: Second signature (title, company)
+            threshold: Optional similarity the caller is looking for (0-1)
         
         Returns:
             Similarity score (0-1)
@@ -183,6 +265,14 @@ class Deduplicator:
         title1, company1 = sig1
         title2, company2 = sig2
         
+        if threshold is not None:
+            upper_bound = (
+                0.7 * _similarity_upper_bound(title1, title2)
+                + 0.3 * _similarity_upper_bound(company1, company2)
+            )
+            if upper_bound < threshold:
+                return 0.0
+        
         # Calculate title similarity
         title_sim = self._calculate_text_similarity(title1, title2)
         
@@ -205,8 +295,11 @@ class Deduplicator:
         Returns:
             Similarity score (0-1)
         """
-        # Use SequenceMatcher for fast similarity calculation
-        return SequenceMatcher(None, text1, text2).ratio()
+        # Identical texts (e.g. the same company) need no matching
+        if text1 == text2:
+            return 1.0
+        
+        return _sequence_ratio(text1, text2)
     
     def find_duplicates(
         self,
@@ -228,16 +321,31 @@ class Deduplicator:
         
         duplicates = []
         
+        signatures = self._signatures(jobs)
+        
+        # Character histograms for the vectorized upper-bound prefilter
+        title_counts = _char_counts([title for title, _ in signatures])
+        company_counts = _char_counts([company for _, company in signatures])
+        
         for i, job1 in enumerate(jobs):
-            for job2 in jobs[i+1:]:
-                # Calculate signature similarity
-                sig1 = (job1.title.lower().strip(), job1.company.lower().strip())
-                sig2 = (job2.title.lower().strip(), job2.company.lower().strip())
-                
-                similarity = self._calculate_signature_similarity(sig1, sig2)
+            others = np.arange(i + 1, len(jobs))
+            
+            # Drop all pairs whose upper bound is below threshold at once
+            upper_bounds = (
+                0.7 * _similarity_upper_bounds(title_counts[i], title_counts[others])
+                + 0.3 * _similarity_upper_bounds(company_counts[i], company_counts[others])
+            )
+            others = others[upper_bounds >= threshold]
+            
+            for j in others.tolist():
+                similarity = self._calculate_signature_similarity(
+                    signatures[i],
+                    signatures[j],
+                    threshold
+                )
                 
                 if similarity >= threshold:
-                    duplicates.append((job1, job2, similarity))
+                    duplicates.append((job1, jobs[j], similarity))
         
         return duplicates
     
@@ -252,13 +360,7 @@ class Deduplicator:
             Dict with deduplication statistics
         """
         # Find exact ID duplicates
-        seen_ids = set()
-        exact_duplicates = 0
-        for job in jobs:
-            if job.id in seen_ids:
-                exact_duplicates += 1
-            else:
-                seen_ids.add(job.id)
+        exact_duplicates = len(jobs) - len({job.id for job in jobs})
         
         # Find similar duplicates
         similar_pairs = self.find_duplicates(jobs)
@@ -1,12 +1,36 @@
 """Job filtering logic - pre-filters jobs before scoring."""
 
-from typing import List, Optional, Dict, Any
+import functools
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from models.job import Job
 from utils.logger import get_logger
 
 
+@functools.lru_cache(maxsize=32)
+def _minimal_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Lowercase keywords for substring matching, dropping redundant ones.
+    
+    A keyword containing another keyword can never be the only match
+    (e.g. 'tech lead' always implies 'lead'), so it is not scanned for.
+    Memoized: filter criteria are usually the same on every call.
+    
+    Args:
+        keywords: Keywords to match (tuple, used as cache key)
+    
+    Returns:
+        Lowercased keywords, shortest first, without duplicates
+    """
+    minimal = []
+    for keyword in sorted({kw.lower() for kw in keywords}, key=lambda kw: (len(kw), kw)):
+        if not any(kept in keyword for kept in minimal):
+            minimal.append(keyword)
+    return tuple(minimal)
+
+
 class JobFilter:
     """
     Filter jobs based on various criteria.
@@ -15,6 +39,18 @@ class JobFilter:
     of jobs that need to be processed.
     """
     
+    # Marks a job as remote (location or remote type); 'full remote' and
+    # 'fully remote' are covered by 'remote'
+    _REMOTE_PATTERN = re.compile(r'remote|work from home', re.IGNORECASE)
+    
+    # Marks a Senior/Lead title ('tech lead'/'team lead' are covered by
+    # 'lead'). Substring matches (e.g. 'Teamlead'), except 'sr' which must
+    # be a whole word ('Sr.' but not 'SRE')
+    _SENIOR_PATTERN = re.compile(
+        r'senior|\bsr\b|lead|principal|staff|architect|head of',
+        re.IGNORECASE
+    )
+    
     def __init__(self):
         """Initialize job filter."""
         self.logger = get_logger("processor.filter")
@@ -27,6 +63,10 @@ class JobFilter:
         """
         Apply filters to job list.
         
+        All filters run in a single pass over the jobs: each job is checked
+        against the filter predicates (cheapest first) and dropped at the
+        first one it fails.
+        
         Args:
             jobs: List of jobs to filter
             criteria: Filter criteria dict with keys:
@@ -44,92 +84,101 @@ class JobFilter:
         if not criteria:
             return jobs
         
-        filtered = jobs
-        initial_count = len(filtered)
+        initial_count = len(jobs)
+        predicates = self._build_predicates(criteria)
         
-        # Apply location filter
-        if criteria.get('locations'):
-            filtered = self._filter_by_location(
-                filtered,
-                criteria['locations']
-            )
-            self.logger.debug(
-                f"Location filter: {initial_count} → {len(filtered)} jobs"
-            )
+        # Jobs dropped per filter (by the first filter they fail)
+        rejected = dict.fromkeys((name for name, _ in predicates), 0)
+        
+        filtered = []
+        for job in jobs:
+            for name, predicate in predicates:
+                if not predicate(job):
+                    rejected[name] += 1
+                    break
+            else:
+                filtered.append(job)
+        
+        for name, count in rejected.items():
+            self.logger.debug(f"{name} filter: {count} jobs removed")
+        
+        retention_pct = len(filtered) / initial_count * 100 if initial_count > 0 else 0.0
+        self.logger.info(
+            f"Total filtering: {initial_count} → {len(filtered)} jobs "
+            f"({retention_pct:.1f}% retained)"
+        )
+        
+        return filtered
+    
+    def _build_predicates(
+        self,
+        criteria: Dict[str, Any]
+    ) -> List[Tuple[str, Callable[[Job], bool]]]:
+        """
+        Build (name, predicate) pairs for the given criteria.
+        
+        Cheap field checks come first and keyword scans over the full
+        description last, so most rejected jobs are never scanned.
+        
+        Args:
+            criteria: Filter criteria (see apply())
+        
+        Returns:
+            List of (filter name, predicate) tuples
+        """
+        predicates = []
         
         # Apply description length filter
         if criteria.get('min_description_length'):
-            filtered = self._filter_by_description_length(
-                filtered,
-                criteria['min_description_length']
-            )
-            self.logger.debug(
-                f"Description length filter: {initial_count} → {len(filtered)} jobs"
-            )
+            predicates.append((
+                'Description length',
+                self._description_length_predicate(criteria['min_description_length'])
+            ))
         
         # Apply age filter
         if criteria.get('max_age_days'):
-            filtered = self._filter_by_age(
-                filtered,
-                criteria['max_age_days']
-            )
-            self.logger.debug(
-                f"Age filter: {initial_count} → {len(filtered)} jobs"
-            )
-        
-        # Apply role keywords filter (must match)
-        if criteria.get('role_keywords'):
-            filtered = self._filter_by_keywords(
-                filtered,
-                criteria['role_keywords'],
-                must_match=True
-            )
-            self.logger.debug(
-                f"Role keywords filter: {initial_count} → {len(filtered)} jobs"
-            )
+            predicates.append((
+                'Age',
+                self._age_predicate(criteria['max_age_days'])
+            ))
         
-        # Apply exclude keywords filter (must not match)
-        if criteria.get('exclude_keywords'):
-            filtered = self._filter_by_keywords(
-                filtered,
-                criteria['exclude_keywords'],
-                must_match=False
-            )
-            self.logger.debug(
-                f"Exclude keywords filter: {initial_count} → {len(filtered)} jobs"
-            )
+        # Apply remote-only filter
+        if criteria.get('remote_only'):
+            predicates.append(('Remote-only', self._is_remote))
         
         # Apply seniority filter (exclude Senior/Lead in title)
         if criteria.get('exclude_senior_lead'):
-            filtered = self._filter_by_seniority(filtered)
-            self.logger.debug(
-                f"Seniority filter (exclude Senior/Lead): {initial_count} → {len(filtered)} jobs"
-            )
-        
-        # Apply remote-only filter
-        if criteria.get('remote_only'):
-            filtered = self._filter_by_remote(filtered)
-            self.logger.debug(
-                f"Remote-only filter: {initial_count} → {len(filtered)} jobs"
-            )
+            predicates.append(('Seniority (exclude Senior/Lead)', self._is_not_senior))
         
         # Apply contract type filter
         if criteria.get('contract_types'):
-            filtered = self._filter_by_contract_type(
-                filtered,
-                criteria['contract_types']
-            )
-            self.logger.debug(
-                f"Contract type filter: {initial_count} → {len(filtered)} jobs"
-            )
+            predicates.append((
+                'Contract type',
+                self._contract_type_predicate(criteria['contract_types'])
+            ))
         
-        retention_pct = len(filtered) / initial_count * 100 if initial_count > 0 else 0.0
-        self.logger.info(
-            f"Total filtering: {initial_count} → {len(filtered)} jobs "
-            f"({retention_pct:.1f}% retained)"
-        )
+        # Apply location filter
+        if criteria.get('locations'):
+            predicates.append((
+                'Location',
+                self._location_predicate(criteria['locations'])
+            ))
         
-        return filtered
+        # Apply role keywords filter (must match)
+        if criteria.get('role_keywords'):
+            predicates.append((
+                'Role keywords',
+                self._keywords_predicate(criteria['role_keywords'], must_match=True)
+            ))
+        
+        # Apply exclude keywords filter (must not match)
+        if criteria.get('exclude_keywords'):
+            predicates.append((
+                'Exclude keywords',
+                self._keywords_predicate(criteria['exclude_keywords'], must_match=False)
+            ))
+        
+        return predicates
     
     def _filter_by_location(
         self,
@@ -146,23 +195,23 @@ class JobFilter:
         Returns:
             Filtered jobs
         """
-        locations_lower = [loc.lower() for loc in locations]
+        return list(filter(self._location_predicate(locations), jobs))
+    
+    def _location_predicate(self, locations: List[str]) -> Callable[[Job], bool]:
+        """Build predicate: job location or remote type matches any location."""
+        locations_lower = _minimal_keywords(tuple(locations))
         
-        filtered = []
-        for job in jobs:
+        def matches(job: Job) -> bool:
             job_location = job.location.lower()
             remote_type = (job.remote_type or '').lower()
             
             # Check if any location matches
-            matches = any(
+            return any(
                 loc in job_location or loc in remote_type
                 for loc in locations_lower
             )
-            
-            if matches:
-                filtered.append(job)
         
-        return filtered
+        return matches
     
     def _filter_by_description_length(
         self,
@@ -179,10 +228,11 @@ class JobFilter:
         Returns:
             Filtered jobs
         """
-        return [
-            job for job in jobs
-            if len(job.description) >= min_length
-        ]
+        return list(filter(self._description_length_predicate(min_length), jobs))
+    
+    def _description_length_predicate(self, min_length: int) -> Callable[[Job], bool]:
+        """Build predicate: description has at least min_length characters."""
+        return lambda job: len(job.description) >= min_length
     
     def _filter_by_age(
         self,
@@ -199,12 +249,19 @@ class JobFilter:
         Returns:
             Filtered jobs
         """
+        return list(filter(self._age_predicate(max_age_days), jobs))
+    
+    def _age_predicate(self, max_age_days: int) -> Callable[[Job], bool]:
+        """Build predicate: job posted within the last max_age_days."""
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
         
-        return [
-            job for job in jobs
-            if job.posted_date >= cutoff_date
-        ]
+        # Same instant as a timezone-aware datetime, for scrapers returning
+        # aware dates (comparing those with a naive cutoff raises TypeError)
+        cutoff_date_aware = cutoff_date.astimezone()
+        
+        return lambda job: job.posted_date >= (
+            cutoff_date if job.posted_date.tzinfo is None else cutoff_date_aware
+        )
     
     def _filter_by_keywords(
         self,
@@ -224,22 +281,31 @@ class JobFilter:
         Returns:
             Filtered jobs
         """
-        keywords_lower = [kw.lower() for kw in keywords]
+        return list(filter(self._keywords_predicate(keywords, must_match), jobs))
+    
+    def _keywords_predicate(
+        self,
+        keywords: List[str],
+        must_match: bool = True
+    ) -> Callable[[Job], bool]:
+        """
+        Build predicate: title/description (does not) match any keyword.
         
-        filtered = []
-        for job in jobs:
-            searchable = f"{job.title} {job.description}".lower()
+        Matches against Job.get_text_lower(), which is cached on the job and
+        shared by both keyword filters and the scoring components.
+        """
+        keywords_lower = _minimal_keywords(tuple(keywords))
+        
+        def include(job: Job) -> bool:
+            text = job.get_text_lower()
             
             # Check if any keyword matches
-            matches = any(kw in searchable for kw in keywords_lower)
+            matches = any(kw in text for kw in keywords_lower)
             
             # Include based on must_match flag
-            if must_match and matches:
-                filtered.append(job)
-            elif not must_match and not matches:
-                filtered.append(job)
+            return matches if must_match else not matches
         
-        return filtered
+        return include
     
     def _filter_by_remote(self, jobs: List[Job]) -> List[Job]:
         """
@@ -251,23 +317,15 @@ class JobFilter:
         Returns:
             Filtered jobs (only remote)
         """
-        remote_keywords = ['remote', 'full remote', 'fully remote', 'work from home']
-        
-        filtered = []
-        for job in jobs:
-            remote_type = (job.remote_type or '').lower()
-            location = job.location.lower()
-            
-            # Check if remote type or location indicates remote
-            is_remote = any(
-                kw in remote_type or kw in location
-                for kw in remote_keywords
-            )
-            
-            if is_remote:
-                filtered.append(job)
-        
-        return filtered
+        return list(filter(self._is_remote, jobs))
+    
+    def _is_remote(self, job: Job) -> bool:
+        """Check if remote type or location indicates remote."""
+        remote_search = self._REMOTE_PATTERN.search
+        return (
+            remote_search(job.remote_type or '') is not None
+            or remote_search(job.location) is not None
+        )
     
     def _filter_by_contract_type(
         self,
@@ -284,21 +342,22 @@ class JobFilter:
         Returns:
             Filtered jobs
         """
-        contract_types_lower = [ct.lower() for ct in contract_types]
+        return list(filter(self._contract_type_predicate(contract_types), jobs))
+    
+    def _contract_type_predicate(self, contract_types: List[str]) -> Callable[[Job], bool]:
+        """Build predicate: contract type matches (jobs without one pass)."""
+        contract_types_lower = _minimal_keywords(tuple(contract_types))
         
-        filtered = []
-        for job in jobs:
-            if job.contract_type:
-                job_contract = job.contract_type.lower()
-                
-                # Check if contract type matches
-                if any(ct in job_contract for ct in contract_types_lower):
-                    filtered.append(job)
-            else:
+        def matches(job: Job) -> bool:
+            if not job.contract_type:
                 # If no contract type specified, include job
-                filtered.append(job)
+                return True
+            
+            # Check if contract type matches
+            job_contract = job.contract_type.lower()
+            return any(ct in job_contract for ct in contract_types_lower)
         
-        return filtered
+        return matches
     
     def _filter_by_seniority(self, jobs: List[Job]) -> List[Job]:
         """
@@ -310,22 +369,11 @@ class JobFilter:
         Returns:
             Jobs without Senior/Lead in title
         """
-        senior_keywords = [
-            'senior', 'sr.', 'sr', 'lead', 'tech lead', 'team lead',
-            'principal', 'staff', 'architect', 'head of'
-        ]
-        
-        filtered = []
-        for job in jobs:
-            title_lower = job.title.lower()
-            
-            # Exclude if any senior keyword found in title
-            has_senior = any(keyword in title_lower for keyword in senior_keywords)
-            
-            if not has_senior:
-                filtered.append(job)
-        
-        return filtered
+        return list(filter(self._is_not_senior, jobs))
+    
+    def _is_not_senior(self, job: Job) -> bool:
+        """Check that no senior keyword is found in title."""
+        return self._SENIOR_PATTERN.search(job.title) is None
     
     def get_filter_stats(
         self,
@@ -1,9 +1,14 @@
 """Score aggregator that combines all scoring components."""
 
-from typing import Dict, Any
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 from models.job import Job
 from models.profile import Profile
 from models.job import ScoreResult
+from matchers.keyword_matcher import KeywordMatcher
+from scorers.base import ComponentScore, ScoreComponent
 from scorers.components import (
     TfidfComponent,
     TechStackComponent,
@@ -15,6 +20,12 @@ from scorers.components import (
 from utils.logger import get_logger
 
 
+@functools.lru_cache(maxsize=8)
+def _reject_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Build (once per keyword tuple) matcher for lowercased hard-reject keywords."""
+    return KeywordMatcher(keyword.lower() for keyword in keywords if keyword)
+
+
 class ScoreAggregator:
     """
     Aggregate scores from all components into final score (0-100).
@@ -44,6 +55,14 @@ class ScoreAggregator:
             'contract': ContractComponent(max_score=2.0)
         }
         
+        # One matcher for the text terms of all components, so each job's
+        # text is scanned once instead of once per component
+        self._text_matcher = KeywordMatcher(
+            term
+            for component in self.components.values()
+            for term in component.text_terms
+        )
+        
         self.logger.info(
             f"Initialized {len(self.components)} scoring components "
             f"(total max: 100 points)"
@@ -58,47 +77,195 @@ class ScoreAggregator:
             job: Job posting to score
             profile: User profile to match against
         
+        Returns:
+            ScoreResult with final score (0-100) and breakdown
+        """
+        return self.score_jobs([job], profile)[0]
+    
+    def score_jobs(
+        self,
+        jobs: List[Job],
+        profile: Profile,
+        max_workers: int = 1
+    ) -> List[ScoreResult]:
+        """
+        Calculate final scores for many jobs against one profile.
+        
+        Each component scores the whole batch in one call, so per-profile
+        work (e.g. fitting TF-IDF on the profile) is done once per batch
+        instead of once per job. Components are independent, so with
+        max_workers > 1 they score the batch concurrently in a thread pool.
+        This only pays off where components spend their time in code that
+        releases the GIL (sparse matmul in corpus mode); pure-Python
+        scoring gains nothing from threads.
+        
+        Args:
+            jobs: Job postings to score
+            profile: User profile to match against
+            max_workers: Max number of components scoring at once
+        
+        Returns:
+            ScoreResult per job, in input order
+        """
+        # Jobs whose title has a hard-reject keyword are not scored at all
+        rejected = self._find_rejected(jobs, profile)
+        scored_jobs = [job for job, keyword in zip(jobs, rejected) if keyword is None]
+        
+        text_hits = [
+            self._text_matcher.find(job.get_text_lower()) for job in scored_jobs
+        ] if self._text_matcher.keywords else None
+        
+        component_results = {}
+        if scored_jobs:
+            def calculate(component: ScoreComponent) -> List[Union[ComponentScore, Exception]]:
+                return self._calculate_component(component, scored_jobs, profile, text_hits)
+            
+            if max_workers > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(self.components))
+                ) as executor:
+                    results = list(executor.map(calculate, self.components.values()))
+            else:
+                results = [calculate(component) for component in self.components.values()]
+            
+            component_results = {
+                name: iter(component_scores)
+                for name, component_scores in zip(self.components, results)
+            }
+        
+        return [
+            self._build_score_result(
+                job,
+                {name: next(results) for name, results in component_results.items()}
+            )
+            if keyword is None
+            else self._zero_result(f"Pre-filtered: title matches hard-reject keyword '{keyword}'")
+            for job, keyword in zip(jobs, rejected)
+        ]
+    
+    def score_jobs_for_profiles(
+        self,
+        jobs: List[Job],
+        profiles: List[Profile],
+        max_workers: int = 4
+    ) -> List[List[ScoreResult]]:
+        """
+        Score the same jobs against several profiles.
+        
+        Profiles are scored concurrently in a thread pool. Components keep
+        no per-call state (TF-IDF fits work on cloned vectorizers), and the
+        heavy parts (tokenizing, sparse matmul, regex scans) run in C code.
+        
+        Args:
+            jobs: Job postings to score
+            profiles: User profiles to match against
+            max_workers: Max number of profiles scored at once
+        
+        Returns:
+            ScoreResult list (see score_jobs()) per profile, in input order
+        """
+        if max_workers <= 1 or len(profiles) <= 1:
+            return [self.score_jobs(jobs, profile) for profile in profiles]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(profiles))) as executor:
+            return list(executor.map(lambda profile: self.score_jobs(jobs, profile), profiles))
+    
+    def _find_rejected(self, jobs: List[Job], profile: Profile) -> List[Optional[str]]:
+        """
+        Find hard-reject keyword (profile preference) in each job title.
+        
+        Args:
+            jobs: Job postings to check
+            profile: User profile with hard_reject_keywords preference
+        
+        Returns:
+            Matched keyword per job (None = score normally)
+        """
+        keywords = profile.get_hard_reject_keywords()
+        if not keywords:
+            return [None] * len(jobs)
+        
+        matcher = _reject_matcher(tuple(keywords))
+        return [matcher.first(job.title.lower()) for job in jobs]
+    
+    def _calculate_component(
+        self,
+        component: ScoreComponent,
+        jobs: List[Job],
+        profile: Profile,
+        text_hits: Optional[List[Set[str]]] = None
+    ) -> List[Union[ComponentScore, Exception]]:
+        """
+        Score a batch with one component.
+        
+        Components with text_terms get the shared text scan hits (text_hits,
+        one set per job) instead of scanning the job text themselves. If the
+        batch call fails, jobs are rescored one by one so a single bad job
+        only zeroes its own component score.
+        
+        Returns:
+            ComponentScore (or the raised exception) per job
+        """
+        try:
+            if component.text_terms and text_hits is not None:
+                return [
+                    component.calculate_with_hits(job, profile, hits)
+                    for job, hits in zip(jobs, text_hits)
+                ]
+            return component.calculate_batch(jobs, profile)
+        except Exception:
+            results = []
+            for job in jobs:
+                try:
+                    results.append(component.calculate(job, profile))
+                except Exception as e:
+                    results.append(e)
+            return results
+    
+    def _build_score_result(
+        self,
+        job: Job,
+        component_results: Dict[str, Union[ComponentScore, Exception]]
+    ) -> ScoreResult:
+        """
+        Combine component results for one job into final ScoreResult.
+        
+        Args:
+            job: Scored job posting
+            component_results: Component name -> ComponentScore or exception
+        
         Returns:
             ScoreResult with final score (0-100) and breakdown
         """
         try:
-            # Calculate score from each component
-            component_scores = {}
             breakdown = {}
             explanations = []
+            total = 0.0
             
-            for name, component in self.components.items():
-                try:
-                    result = component.calculate(job, profile)
-                    
-                    component_scores[name] = result
-                    
-                    breakdown[name] = {
-                        'raw': result.raw_score,
-                        'normalized': result.score,
-                        'max': result.max_score
-                    }
-                    
-                    explanations.append(f"{name.upper()}: {result.explanation}")
-                
-                except Exception as e:
-                    self.logger.error(f"Error in {name} component: {e}")
+            for name, result in component_results.items():
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error in {name} component: {result}")
                     # Assign 0 score if component fails
                     breakdown[name] = {
                         'raw': 0.0,
                         'normalized': 0.0,
-                        'max': component.max_score
+                        'max': self.components[name].max_score
                     }
-                    explanations.append(f"{name.upper()}: Error - {str(e)}")
-            
-            # Calculate final score (sum of normalized scores)
-            final_score = sum(
-                breakdown[name]['normalized']
-                for name in breakdown
-            )
+                    explanations.append(f"{name.upper()}: Error - {str(result)}")
+                    continue
+                
+                breakdown[name] = {
+                    'raw': result.raw_score,
+                    'normalized': result.score,
+                    'max': result.max_score
+                }
+                total += result.score
+                
+                explanations.append(f"{name.upper()}: {result.explanation}")
             
-            # Ensure within bounds
-            final_score = max(0.0, min(final_score, 100.0))
+            # Final score is the sum of normalized scores (failed components
+            # add 0), kept within bounds
+            final_score = max(0.0, min(total, 100.0))
             
             # Generate combined explanation
             explanation = "\n".join(explanations)
@@ -110,14 +277,17 @@ class ScoreAggregator:
                 explanation=explanation
             )
             
-            self.logger.debug(
-                f"Scored job '{job.title}': {final_score:.1f}/100 "
-                f"(TFIDF: {breakdown['tfidf']['normalized']:.1f}, "
-                f"Tech: {breakdown['tech_stack']['normalized']:.1f}, "
-                f"Remote: {breakdown['remote']['normalized']:.1f}, "
-                f"Keywords: {breakdown['keywords']['normalized']:.1f}, "
-                f"Contract: {breakdown['contract']['normalized']:.1f})"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Scored job '%s': %.1f/100 "
+                    "(TFIDF: %.1f, Tech: %.1f, Remote: %.1f, Keywords: %.1f, Contract: %.1f)",
+                    job.title, final_score,
+                    breakdown['tfidf']['normalized'],
+                    breakdown['tech_stack']['normalized'],
+                    breakdown['remote']['normalized'],
+                    breakdown['keywords']['normalized'],
+                    breakdown['contract']['normalized']
+                )
             
             return score_result
         
@@ -125,14 +295,26 @@ class ScoreAggregator:
             self.logger.error(f"Error in score aggregator: {e}")
             
             # Return zero score with error explanation
-            return ScoreResult(
-                score=0.0,
-                breakdown={
-                    name: {'raw': 0.0, 'normalized': 0.0, 'max': comp.max_score}
-                    for name, comp in self.components.items()
-                },
-                explanation=f"Error calculating score: {str(e)}"
-            )
+            return self._zero_result(f"Error calculating score: {str(e)}")
+    
+    def _zero_result(self, explanation: str) -> ScoreResult:
+        """
+        Build zero ScoreResult (all components 0).
+        
+        Args:
+            explanation: Why the job was not scored
+        
+        Returns:
+            ScoreResult with score 0
+        """
+        return ScoreResult(
+            score=0.0,
+            breakdown={
+                name: {'raw': 0.0, 'normalized': 0.0, 'max': comp.max_score}
+                for name, comp in self.components.items()
+            },
+            explanation=explanation
+        )
     
     def get_component_weights(self) -> Dict[str, float]:
         """
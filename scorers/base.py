@@ -2,16 +2,20 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, List, Set, Tuple
+import numpy as np
 from models.job import Job
 from models.profile import Profile
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentScore:
     """
     Result from a scoring component.
     
+    Slotted (no per-instance __dict__): every component creates one per
+    scored job.
+    
     Attributes:
         score: Normalized score (0 to max_score)
         raw_score: Raw score before normalization
@@ -46,6 +50,11 @@ class ScoreComponent(ABC):
     - Contract type preference (5 points)
     """
     
+    # Terms this component looks for in Job.get_text_lower(). The aggregator
+    # scans each job's text once for the terms of all components and passes
+    # the hits to calculate_with_hits()
+    text_terms: Tuple[str, ...] = ()
+    
     def __init__(self, max_score: float):
         """
         Initialize scoring component.
@@ -69,6 +78,39 @@ class ScoreComponent(ABC):
         """
         pass
     
+    def calculate_batch(self, jobs: List[Job], profile: Profile) -> List[ComponentScore]:
+        """
+        Calculate scores for many jobs against one profile.
+        
+        Default scores jobs one by one; components with per-profile setup
+        (fitted vectorizers, compiled patterns) override it to do that once.
+        
+        Args:
+            jobs: Job postings to score
+            profile: User profile to match against
+        
+        Returns:
+            ComponentScore per job, in input order
+        """
+        return [self.calculate(job, profile) for job in jobs]
+    
+    def calculate_with_hits(self, job: Job, profile: Profile, hits: Set[str]) -> ComponentScore:
+        """
+        Calculate score given the terms found in the job text.
+        
+        Default ignores hits; components with text_terms override it to
+        skip their own scan of Job.get_text_lower().
+        
+        Args:
+            job: Job posting to score
+            profile: User profile to match against
+            hits: Terms (of any component's text_terms) found in the job text
+        
+        Returns:
+            ComponentScore with normalized score and explanation
+        """
+        return self.calculate(job, profile)
+    
     def normalize_score(
         self,
         raw_score: float,
@@ -109,3 +151,30 @@ class ScoreComponent(ABC):
         
         # Ensure within bounds
         return max(0.0, min(normalized, self.max_score))
+    
+    def normalize_scores(
+        self,
+        raw_scores: np.ndarray,
+        raw_min: float,
+        raw_max: float
+    ) -> np.ndarray:
+        """
+        Normalize many raw scores to 0-max_score range.
+        
+        Element-wise same as normalize_score().
+        
+        Args:
+            raw_scores: Raw scores to normalize
+            raw_min: Minimum possible raw score
+            raw_max: Maximum possible raw score
+        
+        Returns:
+            Array of normalized scores (0 to max_score)
+        """
+        raw_scores = np.clip(np.asarray(raw_scores, dtype=np.float64), raw_min, raw_max)
+        
+        if raw_max == raw_min:
+            return np.full(raw_scores.shape, self.max_score / 2)
+        
+        normalized = ((raw_scores - raw_min) / (raw_max - raw_min)) * self.max_score
+        return np.clip(normalized, 0.0, self.max_score)
@@ -1,9 +1,12 @@
 """Contract type scoring component (5 points max)."""
 
+import functools
+from typing import Set
 from scorers.base import ScoreComponent, ComponentScore
 from models.job import Job
 from models.profile import Profile
-from config.settings import Settings
+from config.settings import get_settings
+from matchers.keyword_matcher import KeywordMatcher
 from utils.logger import get_logger
 
 
@@ -28,16 +31,32 @@ class ContractComponent(ScoreComponent):
         super().__init__(max_score)
         self.logger = get_logger("scorer.contract")
         
-        # Load scoring rules from config
-        settings = Settings()
-        rules = settings.load_scoring_rules()
+        # Load scoring rules from config (parsed once per process)
+        rules = get_settings().load_scoring_rules()
         
         # Build contract type scoring
         self.contract_scores = self._build_contract_scores(rules)
         
+        # Rule order is match precedence (e.g. "unbefristet" must win over
+        # its substring "befristet"), so the matcher keeps it as is
+        self._matcher = KeywordMatcher(self.contract_scores)
+        self.text_terms = tuple(self.contract_scores)
+        
+        # Explanations by (matched type, raw score): one per rule, so each
+        # is formatted once and then shared
+        self._explanation = functools.lru_cache(maxsize=None)(self._generate_explanation)
+        
         # Define raw score range for normalization
         self.raw_min = -5.0
         self.raw_max = 2.0
+        
+        # Normalized score per possible raw score (rule scores and the
+        # unmatched 0), computed once instead of per job
+        raw_scores = sorted({0.0, *self.contract_scores.values()})
+        self._normalized_scores = dict(zip(
+            raw_scores,
+            self.normalize_scores(raw_scores, self.raw_min, self.raw_max).tolist()
+        ))
     
     def _build_contract_scores(self, rules: dict) -> dict:
         """
@@ -68,6 +87,23 @@ class ContractComponent(ScoreComponent):
             job: Job posting to score
             profile: User profile to match against
         
+        Returns:
+            ComponentScore with contract type score
+        """
+        return self.calculate_with_hits(
+            job, profile, self._matcher.find(job.get_text_lower())
+        )
+    
+    def calculate_with_hits(self, job: Job, profile: Profile, hits: Set[str]) -> ComponentScore:
+        """
+        Calculate contract type score from terms found in the job text.
+        
+        Args:
+            job: Job posting to score
+            profile: User profile to match against
+            hits: Terms found in job title and description (may include
+                other components' terms)
+        
         Returns:
             ComponentScore with contract type score
         """
@@ -78,19 +114,15 @@ class ContractComponent(ScoreComponent):
             # Match against known contract types
             raw_score, matched_type = self._match_contract_type(
                 contract_type,
-                job.title,
-                job.description
+                job.get_text_lower(),
+                hits
             )
             
             # Normalize score: [-5, 2] → [0, max_score]
-            normalized_score = self.normalize_score(
-                raw_score,
-                self.raw_min,
-                self.raw_max
-            )
+            normalized_score = self._normalized_scores[raw_score]
             
             # Generate explanation
-            explanation = self._generate_explanation(matched_type, raw_score)
+            explanation = self._explanation(matched_type, raw_score)
             
             return ComponentScore(
                 score=normalized_score,
@@ -116,27 +148,29 @@ class ContractComponent(ScoreComponent):
     def _match_contract_type(
         self,
         contract_type: str,
-        title: str,
-        description: str
+        text_lower: str,
+        hits: Set[str]
     ) -> tuple:
         """
         Match contract type against scoring rules.
         
         Args:
             contract_type: Contract type field
-            title: Job title
-            description: Job description
+            text_lower: Lowercased job title and description (Job.get_text_lower())
+            hits: Terms found in text_lower
         
         Returns:
             Tuple of (score, matched_type_name)
         """
-        # Combine all text for matching
-        combined_text = f"{contract_type} {title} {description}".lower()
-        
-        # Try to match each contract type
-        for contract_name, score in self.contract_scores.items():
-            if contract_name in combined_text:
-                return score, contract_name
+        # Matching "{contract_type} {text_lower}" without copying the job
+        # text: matches starting in the contract type field or the separator
+        # end within max_length - 1 chars of text_lower, all others are hits
+        head = f"{contract_type.lower()} {text_lower[:self._matcher.max_length - 1]}"
+        
+        # First contract type (in rule order) found in the text
+        contract_name = self._matcher.first_of(hits | self._matcher.find(head))
+        if contract_name is not None:
+            return self.contract_scores[contract_name], contract_name
         
         # No match: assume standard contract (0 score)
         return 0.0, "standard contract (unspecified)"
@@ -1,10 +1,11 @@
 """Keywords scoring component (10 points max)."""
 
-from typing import Dict, List
+from typing import Dict, List, Set
 from scorers.base import ScoreComponent, ComponentScore
 from models.job import Job
 from models.profile import Profile
-from config.settings import Settings
+from config.settings import get_settings
+from matchers.keyword_matcher import KeywordMatcher
 from utils.logger import get_logger
 
 
@@ -30,12 +31,17 @@ class KeywordComponent(ScoreComponent):
         super().__init__(max_score)
         self.logger = get_logger("scorer.keywords")
         
-        # Load scoring rules from config
-        settings = Settings()
-        rules = settings.load_scoring_rules()
+        # Load scoring rules from config (parsed once per process)
+        rules = get_settings().load_scoring_rules()
         
         # Build keyword scoring lookup
         self.keywords = self._build_keywords(rules)
+        self._matcher = KeywordMatcher(self.keywords)
+        self.text_terms = tuple(self.keywords)
+        
+        # Keyword -> rule position, to order the few matched keywords
+        # without walking all rules per job
+        self._keyword_rank = {keyword: rank for rank, keyword in enumerate(self.keywords)}
     
     def _build_keywords(self, rules: dict) -> Dict[str, float]:
         """
@@ -77,21 +83,41 @@ class KeywordComponent(ScoreComponent):
             job: Job posting to score
             profile: User profile to match against
         
+        Returns:
+            ComponentScore with keyword match score
+        """
+        return self.calculate_with_hits(
+            job, profile, self._matcher.find(job.get_text_lower())
+        )
+    
+    def calculate_with_hits(self, job: Job, profile: Profile, hits: Set[str]) -> ComponentScore:
+        """
+        Calculate keyword match score from terms found in the job text.
+        
+        Args:
+            job: Job posting to score
+            profile: User profile to match against
+            hits: Terms found in job title and description (may include
+                other components' terms)
+        
         Returns:
             ComponentScore with keyword match score
         """
         try:
             # Search for keywords in job description and title
-            combined_text = f"{job.title} {job.description}".lower()
-            
-            # Match keywords
-            raw_score = 0.0
-            matched_keywords = {}
+            combined_text = job.get_text_lower()
             
-            for keyword, score in self.keywords.items():
-                if keyword in combined_text:
-                    raw_score += score
-                    matched_keywords[keyword] = score
+            # Match keywords (a keyword only found inside a longer one, e.g.
+            # "vor ort" in "3-5 tage vor ort", is not counted twice), then
+            # collect their scores in rule order
+            found = self._matcher.find_longest(
+                combined_text, hits.intersection(self.keywords)
+            )
+            matched_keywords = {
+                keyword: self.keywords[keyword]
+                for keyword in sorted(found, key=self._keyword_rank.__getitem__)
+            }
+            raw_score = sum(matched_keywords.values(), 0.0)
             
             # Normalize: cap at max_score, floor at 0
             normalized_score = max(0.0, min(raw_score, self.max_score))
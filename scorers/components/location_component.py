@@ -1,13 +1,13 @@
 """Location scoring component (15 points max)."""
 
-from pathlib import Path
-from typing import Dict, List, Set
-import yaml
+from typing import Dict, List, Set, Tuple
+import functools
+import re
 
 from scorers.base import ScoreComponent, ComponentScore
 from models.job import Job
 from models.profile import Profile
-from config.settings import Settings
+from config.settings import get_settings
 from utils.logger import get_logger
 
 
@@ -27,6 +27,9 @@ class LocationComponent(ScoreComponent):
     Uses config/location_synonyms.yaml for synonym mapping.
     """
     
+    # Max number of distinct location strings kept in the match cache
+    LOCATION_CACHE_SIZE = 4096
+    
     def __init__(self, max_score: float = 15.0):
         """Initialize location component."""
         super().__init__(max_score)
@@ -41,6 +44,23 @@ class LocationComponent(ScoreComponent):
         self.europe_terms = self._build_europe_terms()
         self.neighbor_terms = self._build_neighbor_terms()
         
+        # One compiled alternation per term set: each location is scanned
+        # once per set instead of once per term
+        self._germany_re = self._build_pattern(self.germany_terms)
+        self._remote_re = self._build_pattern(self.remote_terms)
+        self._europe_re = self._build_pattern(self.europe_terms)
+        self._neighbor_re = self._build_pattern(self.neighbor_terms)
+        
+        # Explanations by (location type, score, bonus): only a few distinct
+        # strings exist, so each is formatted once and then shared
+        self._explanation = functools.lru_cache(maxsize=None)(self._generate_explanation)
+        
+        # Term matches by location text: postings share a small set of
+        # location strings ("Berlin, Germany", "Remote", ...)
+        self._match_location = functools.lru_cache(maxsize=self.LOCATION_CACHE_SIZE)(
+            self._match_location_terms
+        )
+        
         self.logger.info(
             f"Loaded location synonyms: "
             f"{len(self.germany_terms)} Germany terms, "
@@ -52,21 +72,17 @@ class LocationComponent(ScoreComponent):
         """
         Load location synonyms from YAML file.
         
+        Parsed once per process (shared settings cache); treat as read-only.
+        
         Returns:
             Dict with synonym mappings
         """
         try:
-            synonyms_path = Path(__file__).parent.parent.parent / "config" / "location_synonyms.yaml"
+            return get_settings().load_yaml("location_synonyms.yaml")
             
-            if not synonyms_path.exists():
-                self.logger.warning(f"location_synonyms.yaml not found at {synonyms_path}")
-                return self._get_default_synonyms()
-            
-            with open(synonyms_path, 'r', encoding='utf-8') as f:
-                synonyms = yaml.safe_load(f)
-            
-            self.logger.info(f"Loaded location synonyms from {synonyms_path}")
-            return synonyms
+        except FileNotFoundError as e:
+            self.logger.warning(f"location_synonyms.yaml not found: {e}")
+            return self._get_default_synonyms()
             
         except Exception as e:
             self.logger.error(f"Failed to load location synonyms: {e}")
@@ -156,27 +172,9 @@ class LocationComponent(ScoreComponent):
         location_text = f"{job.location} {job.remote_type or ''}".lower()
         
         # Check for matches
-        is_germany = self._matches_any(location_text, self.germany_terms)
-        is_remote = self._matches_any(location_text, self.remote_terms)
-        is_europe = self._matches_any(location_text, self.europe_terms)
-        is_neighbor = self._matches_any(location_text, self.neighbor_terms)
-        
-        # Calculate base score
-        base_score = 0.0
-        location_type = "Unknown"
-        
-        if is_germany:
-            base_score = 15.0
-            location_type = "Germany"
-        elif is_neighbor:
-            base_score = 8.0
-            location_type = "Neighboring Country"
-        elif is_europe:
-            base_score = 8.0
-            location_type = "Europe"
-        else:
-            base_score = 3.0
-            location_type = "Other"
+        location_type, base_score, is_germany, is_remote, is_europe = (
+            self._match_location(location_text)
+        )
         
         # Remote bonus (can stack with location score, but capped at max_score)
         remote_bonus = 0.0
@@ -187,12 +185,8 @@ class LocationComponent(ScoreComponent):
         # Cap at max_score
         final_score = min(base_score, self.max_score)
         
-        # Build explanation
-        explanation_parts = [f"{location_type}: {base_score:.1f}pts"]
-        if remote_bonus > 0:
-            explanation_parts.append(f"Remote bonus: +{remote_bonus:.1f}pts")
-        
-        explanation = ", ".join(explanation_parts)
+        # Build explanation (one of a few strings, built once each)
+        explanation = self._explanation(location_type, base_score, remote_bonus)
         
         # Build details
         details = {
@@ -206,8 +200,8 @@ class LocationComponent(ScoreComponent):
         }
         
         self.logger.debug(
-            f"Location score for '{job.location}' ({job.remote_type}): "
-            f"{final_score:.1f}/{self.max_score} - {explanation}"
+            "Location score for '%s' (%s): %.1f/%s - %s",
+            job.location, job.remote_type, final_score, self.max_score, explanation
         )
         
         return ComponentScore(
@@ -218,18 +212,69 @@ class LocationComponent(ScoreComponent):
             details=details
         )
     
-    def _matches_any(self, text: str, terms: Set[str]) -> bool:
+    def _generate_explanation(
+        self,
+        location_type: str,
+        base_score: float,
+        remote_bonus: float
+    ) -> str:
         """
-        Check if any term from set appears in text.
+        Generate human-readable explanation.
+        
+        Args:
+            location_type: Matched location type
+            base_score: Location score including remote bonus
+            remote_bonus: Remote bonus points
+        
+        Returns:
+            Explanation text
+        """
+        explanation_parts = [f"{location_type}: {base_score:.1f}pts"]
+        if remote_bonus > 0:
+            explanation_parts.append(f"Remote bonus: +{remote_bonus:.1f}pts")
+        
+        return ", ".join(explanation_parts)
+    
+    def _match_location_terms(self, location_text: str) -> Tuple[str, float, bool, bool, bool]:
+        """
+        Match location text against the term sets.
+        
+        Args:
+            location_text: Lowercased "location remote_type" text
+        
+        Returns:
+            Tuple of (location_type, base_score, is_germany, is_remote, is_europe)
+        """
+        # is_germany, is_remote and is_europe are also reported in details;
+        # neighbor is only needed outside Germany
+        is_germany = self._germany_re.search(location_text) is not None
+        is_remote = self._remote_re.search(location_text) is not None
+        is_europe = self._europe_re.search(location_text) is not None
+        
+        if is_germany:
+            location_type, base_score = "Germany", 15.0
+        elif self._neighbor_re.search(location_text) is not None:
+            location_type, base_score = "Neighboring Country", 8.0
+        elif is_europe:
+            location_type, base_score = "Europe", 8.0
+        else:
+            location_type, base_score = "Other", 3.0
+        
+        return location_type, base_score, is_germany, is_remote, is_europe
+    
+    @staticmethod
+    def _build_pattern(terms: Set[str]) -> re.Pattern:
+        """
+        Build regex matching any term from set as a plain substring.
         
         Args:
-            text: Text to search in (already lowercase)
             terms: Set of terms to search for (already lowercase)
         
         Returns:
-            True if any term found
+            Compiled regex (never matches if terms is empty)
         """
-        for term in terms:
-            if term in text:
-                return True
-        return False
+        if not terms:
+            return re.compile(r'(?!)')
+        
+        # Longest first, so a term is not shadowed by one of its prefixes
+        return re.compile('|'.join(map(re.escape, sorted(terms, key=len, reverse=True))))
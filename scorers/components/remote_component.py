@@ -1,13 +1,80 @@
 """Remote type scoring component (15 points max)."""
 
+import functools
 import re
+from typing import Dict, Tuple
 from scorers.base import ScoreComponent, ComponentScore
 from models.job import Job
 from models.profile import Profile
-from config.settings import Settings
+from config.settings import get_settings
 from utils.logger import get_logger
 
 
+# Characters that make a pattern more than a plain phrase
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """
+    Rewrite a case-insensitive pattern to match lowercased text.
+    
+    Searching lowercased text without re.IGNORECASE is several times
+    faster. Patterns with escapes keep a scoped (?i:...) flag instead, as
+    lowercasing would change them (\\D -> \\d).
+    
+    Args:
+        pattern: Regex pattern (matched case-insensitively)
+    
+    Returns:
+        Group matching the same lowercased text
+    """
+    if "\\" in pattern:
+        return f"(?i:{pattern})"
+    return f"(?:{pattern.lower()})"
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_patterns(spec: Tuple[Tuple[str, float, Tuple[str, ...]], ...]) -> Dict[str, dict]:
+    """
+    Compile remote type patterns, once per distinct rule set.
+    
+    Plain phrases ("100% remote", "vor Ort") are kept as lowercase literals
+    for substring checks; only true patterns ("2 Tage.*Woche") go into the
+    type's combined regex.
+    
+    Args:
+        spec: (type_name, score, pattern strings) per remote type
+    
+    Returns:
+        Dict of {type_name: {'score': float, 'patterns': [compiled_regex],
+        'literals': (str, ...), 'combined': compiled_regex or None}} where
+        'combined' matches lowercased text if any non-literal pattern does
+        (shared between components: treat as read-only)
+    """
+    patterns = {}
+    
+    for type_name, score, pattern_strings in spec:
+        literals = tuple(
+            pattern.lower() for pattern in pattern_strings
+            if _REGEX_METACHARACTERS.isdisjoint(pattern)
+        )
+        regexes = [
+            pattern for pattern in pattern_strings
+            if not _REGEX_METACHARACTERS.isdisjoint(pattern)
+        ]
+        
+        patterns[type_name] = {
+            'score': score,
+            'patterns': [re.compile(pattern, re.IGNORECASE) for pattern in pattern_strings],
+            'literals': literals,
+            'combined': re.compile(
+                "|".join(_lowercase_pattern(pattern) for pattern in regexes)
+            ) if regexes else None
+        }
+    
+    return patterns
+
+
 class RemoteComponent(ScoreComponent):
     """
     Score job based on remote work preferences.
@@ -23,21 +90,55 @@ class RemoteComponent(ScoreComponent):
     Normalization: Maps [-3, 5] → [0, 15]
     """
     
+    # Remote types checked in order; the first type with a matching
+    # pattern wins (negative first)
+    MATCH_ORDER = ('onsite_required', 'hybrid_2days', 'hybrid_1day', 'full_remote')
+    
+    # Max number of (description, remote type) pairs kept in the match cache
+    MATCH_CACHE_SIZE = 4096
+    
     def __init__(self, max_score: float = 15.0):
         """Initialize remote component."""
         super().__init__(max_score)
         self.logger = get_logger("scorer.remote")
         
-        # Load scoring rules from config
-        settings = Settings()
-        rules = settings.load_scoring_rules()
+        # Load scoring rules from config (parsed once per process)
+        rules = get_settings().load_scoring_rules()
         
         # Build remote patterns
         self.patterns = self._build_patterns(rules)
         
+        # (score, type_name, literals, combined pattern) in match order
+        # (negative first): substring checks plus at most one regex search
+        # per remote type instead of one search per pattern
+        self._match_order = [
+            (
+                self.patterns[type_name]['score'],
+                type_name,
+                self.patterns[type_name]['literals'],
+                self.patterns[type_name]['combined']
+            )
+            for type_name in self.MATCH_ORDER
+            if type_name in self.patterns
+        ]
+        
+        # Pattern matches by (description, remote type): scoring the same
+        # jobs for several profiles scans each description once
+        self._match_patterns = functools.lru_cache(maxsize=self.MATCH_CACHE_SIZE)(
+            self._search_patterns
+        )
+        
         # Define raw score range for normalization
         self.raw_min = -3.0
         self.raw_max = 5.0
+        
+        # Normalized score per possible raw score (pattern scores and the
+        # neutral 0), computed once instead of per job
+        raw_scores = sorted({0.0, *(config['score'] for config in self.patterns.values())})
+        self._normalized_scores = dict(zip(
+            raw_scores,
+            self.normalize_scores(raw_scores, self.raw_min, self.raw_max).tolist()
+        ))
     
     def _build_patterns(self, rules: dict) -> dict:
         """
@@ -47,26 +148,18 @@ class RemoteComponent(ScoreComponent):
             rules: Loaded scoring_rules.yaml
         
         Returns:
-            Dict of {type_name: {'score': float, 'patterns': [compiled_regex]}}
+            Dict of {type_name: {'score': float, 'patterns': [compiled_regex],
+            'literals': (str, ...), 'combined': compiled_regex or None}}
         """
-        patterns = {}
-        
         remote_rules = rules.get('remote', {}).get('patterns', {})
         
-        for type_name, config in remote_rules.items():
-            score = config.get('score', 0)
-            pattern_strings = config.get('patterns', [])
-            
-            # Compile regex patterns
-            compiled_patterns = [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in pattern_strings
-            ]
-            
-            patterns[type_name] = {
-                'score': score,
-                'patterns': compiled_patterns
-            }
+        # Compiled patterns are shared by all components built from the
+        # same rules (e.g. one scorer per profile)
+        spec = tuple(
+            (type_name, config.get('score', 0), tuple(config.get('patterns', [])))
+            for type_name, config in remote_rules.items()
+        )
+        patterns = dict(_compile_patterns(spec))
         
         self.logger.info(f"Loaded {len(patterns)} remote type patterns")
         return patterns
@@ -101,11 +194,7 @@ class RemoteComponent(ScoreComponent):
                 matched_type = "neutral (remote not preferred in profile)"
             
             # Normalize score: [-3, 5] → [0, max_score]
-            normalized_score = self.normalize_score(
-                raw_score,
-                self.raw_min,
-                self.raw_max
-            )
+            normalized_score = self._normalized_scores[raw_score]
             
             # Generate explanation
             explanation = self._generate_explanation(
@@ -136,10 +225,12 @@ class RemoteComponent(ScoreComponent):
                 details={}
             )
     
-    def _match_patterns(self, description: str, remote_type: str) -> tuple:
+    def _search_patterns(self, description: str, remote_type: str) -> tuple:
         """
         Match job description against remote patterns.
         
+        Memoized as _match_patterns().
+        
         Args:
             description: Job description text
             remote_type: Remote type field
@@ -147,21 +238,20 @@ class RemoteComponent(ScoreComponent):
         Returns:
             Tuple of (score, matched_type_name)
         """
-        combined_text = f"{remote_type} {description}"
+        # Without a remote type, search the description itself rather than
+        # a copy behind a separator (no pattern starts with whitespace)
+        combined_text = f"{remote_type} {description}" if remote_type else description
+        
+        # Lowercased once; literals and combined patterns are lowercase
+        text_lower = combined_text.lower()
         
         # Try to match each pattern type (order matters: check negative first)
         # Check in order: onsite, hybrid_2days, hybrid_1day, full_remote
-        match_order = ['onsite_required', 'hybrid_2days', 'hybrid_1day', 'full_remote']
-        
-        for type_name in match_order:
-            if type_name not in self.patterns:
-                continue
-            
-            config = self.patterns[type_name]
-            
-            for pattern in config['patterns']:
-                if pattern.search(combined_text):
-                    return config['score'], type_name
+        for score, type_name, literals, pattern in self._match_order:
+            if any(literal in text_lower for literal in literals):
+                return score, type_name
+            if pattern is not None and pattern.search(text_lower):
+                return score, type_name
         
         # No match: assume hybrid 2 days (neutral)
         return 0.0, "unknown (assumed hybrid)"
@@ -1,13 +1,38 @@
 """Tech stack scoring component (30 points max)."""
 
-from typing import Dict, Set
+import functools
+from typing import Dict, FrozenSet, Set, Tuple
 from scorers.base import ScoreComponent, ComponentScore
 from models.job import Job
 from models.profile import Profile
-from config.settings import Settings
+from config.settings import Settings, get_settings
 from utils.logger import get_logger
 
 
+@functools.lru_cache(maxsize=8)
+def _load_tech_scores(settings: Settings) -> Tuple[Dict[str, float], FrozenSet[str]]:
+    """
+    Build tech term → score mapping from scoring rules, once per Settings.
+    
+    Args:
+        settings: Settings to load scoring_rules.yaml from
+    
+    Returns:
+        Tuple of (dict mapping tech term (lowercase) to score, set of its
+        terms); shared between components: treat as read-only
+    """
+    tech_scores = {}
+    
+    tech_rules = settings.load_scoring_rules().get('tech_stack', {})
+    
+    # High priority, medium priority, then negative tech
+    for group in ('high_priority', 'medium_priority', 'negative'):
+        for item in tech_rules.get(group, []):
+            tech_scores[item['term'].lower()] = item['score']
+    
+    return tech_scores, frozenset(tech_scores)
+
+
 class TechStackComponent(ScoreComponent):
     """
     Score job based on tech stack match with profile skills.
@@ -30,44 +55,10 @@ class TechStackComponent(ScoreComponent):
         super().__init__(max_score)
         self.logger = get_logger("scorer.tech_stack")
         
-        # Load scoring rules from config
-        settings = Settings()
-        rules = settings.load_scoring_rules()
-        
-        # Build tech scoring lookup table
-        self.tech_scores = self._build_tech_scores(rules)
-    
-    def _build_tech_scores(self, rules: dict) -> Dict[str, float]:
-        """
-        Build tech term → score mapping from scoring rules.
-        
-        Args:
-            rules: Loaded scoring_rules.yaml
-        
-        Returns:
-            Dict mapping tech term (lowercase) to score
-        """
-        tech_scores = {}
-        
-        tech_rules = rules.get('tech_stack', {})
-        
-        # High priority tech
-        for item in tech_rules.get('high_priority', []):
-            term = item['term'].lower()
-            tech_scores[term] = item['score']
-        
-        # Medium priority tech
-        for item in tech_rules.get('medium_priority', []):
-            term = item['term'].lower()
-            tech_scores[term] = item['score']
-        
-        # Negative tech
-        for item in tech_rules.get('negative', []):
-            term = item['term'].lower()
-            tech_scores[term] = item['score']
-        
-        self.logger.info(f"Loaded {len(tech_scores)} tech scoring rules")
-        return tech_scores
+        # Tech scoring lookup table (built once per process from
+        # scoring_rules.yaml, shared by all instances)
+        self.tech_scores, self._tech_keys = _load_tech_scores(get_settings())
+        self.logger.info(f"Loaded {len(self.tech_scores)} tech scoring rules")
     
     def calculate(self, job: Job, profile: Profile) -> ComponentScore:
         """
@@ -81,24 +72,17 @@ class TechStackComponent(ScoreComponent):
             ComponentScore with tech match score
         """
         try:
-            # Get tech stack from job
-            job_tech = set(t.lower() for t in job.tech_stack)
-            
-            # Get profile skills (already returns list of strings)
-            profile_skills = set(
-                skill.lower()
-                for skill in profile.get_all_skills_flat()
-            )
+            # Get tech stack from job (lowercased once per job)
+            job_tech = job.get_tech_stack_lower()
             
-            # Calculate raw score
-            raw_score = 0.0
-            matched_tech = {}
+            # Get profile skills (lowercased once per profile)
+            profile_skills = profile.get_skills_lower()
             
-            for tech in job_tech:
-                if tech in self.tech_scores:
-                    score = self.tech_scores[tech]
-                    raw_score += score
-                    matched_tech[tech] = score
+            # Calculate raw score (set intersection instead of a lookup
+            # per job tech)
+            tech_scores = self.tech_scores
+            matched_tech = {tech: tech_scores[tech] for tech in job_tech & self._tech_keys}
+            raw_score = sum(matched_tech.values(), 0.0)
             
             # Normalize: cap at max_score, floor at 0
             normalized_score = max(0.0, min(raw_score, self.max_score))
@@ -162,9 +146,13 @@ class TechStackComponent(ScoreComponent):
         top_3 = sorted_matches[:3]
         top_3_text = ", ".join(f"{tech} ({score:+.0f})" for tech, score in top_3)
         
-        # Count positives and negatives
-        positives = sum(1 for s in matched_tech.values() if s > 0)
-        negatives = sum(1 for s in matched_tech.values() if s < 0)
+        # Count positives and negatives (single pass)
+        positives = negatives = 0
+        for score in matched_tech.values():
+            if score > 0:
+                positives += 1
+            elif score < 0:
+                negatives += 1
         
         explanation = (
             f"Matched {len(matched_tech)}/{len(job_tech)} technologies "
@@ -1,5 +1,6 @@
 """TF-IDF similarity scoring component (40 points max)."""
 
+from typing import List
 from scorers.base import ScoreComponent, ComponentScore
 from models.job import Job
 from models.profile import Profile
@@ -39,35 +40,9 @@ class TfidfComponent(ScoreComponent):
             ComponentScore with similarity-based score
         """
         try:
-            # Calculate cosine similarity
-            similarity = self.matcher.calculate_similarity(
-                job.description,
-                profile.profile_text
-            )
-            
-            # Raw score is the similarity (0.0 to 1.0)
-            raw_score = similarity
-            
-            # Normalized score: similarity * max_score
-            normalized_score = similarity * self.max_score
-            
-            # Generate explanation
-            explanation = self._generate_explanation(similarity)
-            
-            # Get top TF-IDF terms for details
-            job_tfidf = self.matcher.get_tfidf_scores(job.description)
-            top_job_terms = list(job_tfidf.keys())[:10] if job_tfidf else []
-            
-            return ComponentScore(
-                score=normalized_score,
-                raw_score=raw_score,
-                max_score=self.max_score,
-                explanation=explanation,
-                details={
-                    'similarity': similarity,
-                    'top_job_terms': top_job_terms
-                }
-            )
+            # A batch of one: same scores as batch scoring, without a
+            # vectorizer fit per call
+            return self.calculate_batch([job], profile)[0]
         
         except Exception as e:
             self.logger.error(f"Error calculating TF-IDF score: {e}")
@@ -79,6 +54,61 @@ class TfidfComponent(ScoreComponent):
                 details={}
             )
     
+    def calculate_batch(self, jobs: List[Job], profile: Profile) -> List[ComponentScore]:
+        """
+        Calculate TF-IDF similarity scores for many jobs.
+        
+        Same scores as calculate() per job, but all job descriptions are
+        tokenized in one pass by the matcher's batch methods.
+        
+        Args:
+            jobs: Job postings to score
+            profile: User profile to match against
+        
+        Returns:
+            ComponentScore per job, in input order
+        """
+        descriptions = [job.description for job in jobs]
+        
+        similarities = self.matcher.calculate_similarities(descriptions, profile.profile_text)
+        top_terms = self.matcher.get_top_terms(descriptions, 10)
+        
+        return [
+            self._build_score(float(similarity), terms)
+            for similarity, terms in zip(similarities, top_terms)
+        ]
+    
+    def _build_score(self, similarity: float, top_job_terms: List[str]) -> ComponentScore:
+        """
+        Build component score from similarity.
+        
+        Args:
+            similarity: Cosine similarity (0-1)
+            top_job_terms: Top TF-IDF terms of the job description
+        
+        Returns:
+            ComponentScore with similarity-based score
+        """
+        # Raw score is the similarity (0.0 to 1.0)
+        raw_score = similarity
+        
+        # Normalized score: similarity * max_score
+        normalized_score = similarity * self.max_score
+        
+        # Generate explanation
+        explanation = self._generate_explanation(similarity)
+        
+        return ComponentScore(
+            score=normalized_score,
+            raw_score=raw_score,
+            max_score=self.max_score,
+            explanation=explanation,
+            details={
+                'similarity': similarity,
+                'top_job_terms': top_job_terms
+            }
+        )
+    
     def _generate_explanation(self, similarity: float) -> str:
         """
         Generate human-readable explanation.
@@ -5,8 +5,9 @@ Adzuna provides a free API with rate limits (250 calls/month for free tier).
 API Documentation: https://developer.adzuna.com/docs/search
 """
 
+import asyncio
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
@@ -32,6 +33,12 @@ class AdzunaScraper(BaseScraper):
     
     BASE_API_URL = "https://api.adzuna.com/v1/api"
     
+    # Remote indicators in lowercased title/description/location
+    REMOTE_KEYWORDS = (
+        "remote", "work from home", "wfh", "distributed",
+        "anywhere", "telecommute", "home office"
+    )
+    
     def __init__(
         self,
         app_id: Optional[str] = None,
@@ -79,6 +86,13 @@ class AdzunaScraper(BaseScraper):
         """
         Fetch jobs from Adzuna API.
         
+        Page 1 is fetched alone; if it is short (fewer than
+        results_per_page results) no further pages are requested.
+        Otherwise pages 2..max_pages are requested concurrently, so a
+        short page 2 still costs the calls for the later pages: faster
+        fetches traded for up to max_pages - 2 extra calls against the
+        monthly quota.
+        
         Args:
             keywords: Search keywords (e.g., ["Full Stack", "Backend"])
             location: Location filter (e.g., "Berlin", "Munich", "Germany")
@@ -99,37 +113,74 @@ class AdzunaScraper(BaseScraper):
             f"(max {self.max_pages} pages)"
         )
         
-        for page in range(1, self.max_pages + 1):
-            try:
-                page_jobs = await self._fetch_page(
-                    search_query=search_query,
-                    location=location,
-                    page=page
-                )
-                
-                jobs.extend(page_jobs)
-                
-                self.logger.debug(
-                    f"Page {page}/{self.max_pages}: {len(page_jobs)} jobs found"
-                )
-                
-                # Stop if no more results
-                if len(page_jobs) == 0:
-                    break
-                
-            except Exception as e:
-                self.logger.error(f"Error fetching page {page}: {e}")
-                # Continue with other pages
+        # First page alone: a short result is the last page and needs no
+        # further requests. Remaining pages are then requested concurrently
+        # (the rate limiter still spaces the requests, but their round
+        # trips overlap)
+        pages = range(1, self.max_pages + 1)
+        page_results = []
+        if pages:
+            page_results.append(await self._fetch_page_safe(search_query, location, pages[0]))
+        if page_results and (
+            page_results[0] is None or page_results[0][1] >= self.results_per_page
+        ):
+            page_results += await asyncio.gather(*(
+                self._fetch_page_safe(search_query, location, page)
+                for page in pages[1:]
+            ))
+        
+        for page, page_result in zip(pages, page_results):
+            if page_result is None:
+                # Failed page (logged): continue with other pages
+                continue
+            
+            page_jobs, result_count = page_result
+            jobs.extend(page_jobs)
+            
+            self.logger.debug(
+                f"Page {page}/{self.max_pages}: {len(page_jobs)} jobs found"
+            )
+            
+            # Stop after the last (short) page
+            if result_count < self.results_per_page:
+                break
         
         self.logger.info(f"Adzuna: Found {len(jobs)} jobs total")
         return jobs
     
+    async def _fetch_page_safe(
+        self,
+        search_query: str,
+        location: str,
+        page: int
+    ) -> Optional[Tuple[List[Job], int]]:
+        """
+        Fetch a single page, logging errors instead of raising them.
+        
+        Args:
+            search_query: Search query string
+            location: Location filter
+            page: Page number (1-indexed)
+        
+        Returns:
+            Same as _fetch_page(), or None if fetching failed
+        """
+        try:
+            return await self._fetch_page(
+                search_query=search_query,
+                location=location,
+                page=page
+            )
+        except Exception as e:
+            self.logger.error(f"Error fetching page {page}: {e}")
+            return None
+    
     async def _fetch_page(
         self,
         search_query: str,
         location: str,
         page: int
-    ) -> List[Job]:
+    ) -> Tuple[List[Job], int]:
         """
         Fetch a single page of results from Adzuna API.
         
@@ -139,7 +190,8 @@ class AdzunaScraper(BaseScraper):
             page: Page number (1-indexed)
         
         Returns:
-            List of Job objects from this page
+            Tuple of (Job objects from this page, number of results the
+            API returned, including ones that failed to parse)
         """
         # Build API URL
         endpoint = f"{self.BASE_API_URL}/jobs/{self.country}/search/{page}"
@@ -161,15 +213,15 @@ class AdzunaScraper(BaseScraper):
         
         # Fetch data
         client = await self._get_client()
-        response = await client.get(url)
+        response = await client.get(url, timeout=self.timeout)
         
         # Check for rate limit errors
         if response.status_code == 429:
             self.logger.warning("Adzuna API rate limit exceeded")
-            return []
+            return [], 0
         
         response.raise_for_status()
-        data = response.json()
+        data = self._parse_json(response)
         
         # Parse results
         jobs = []
@@ -184,7 +236,7 @@ class AdzunaScraper(BaseScraper):
                 self.logger.debug(f"Error parsing job: {e}")
                 continue
         
-        return jobs
+        return jobs, len(results)
     
     def parse_job(self, item: Dict[str, Any]) -> Optional[Job]:
         """
@@ -267,12 +319,7 @@ class AdzunaScraper(BaseScraper):
         text = f"{title} {description} {location}".lower()
         
         # Check for remote indicators
-        remote_keywords = [
-            "remote", "work from home", "wfh", "distributed",
-            "anywhere", "telecommute", "home office"
-        ]
-        
-        if any(keyword in text for keyword in remote_keywords):
+        if any(keyword in text for keyword in self.REMOTE_KEYWORDS):
             # Check for hybrid
             if "hybrid" in text:
                 return "Hybrid"
@@ -280,8 +327,3 @@ class AdzunaScraper(BaseScraper):
         
         return "Onsite"
     
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
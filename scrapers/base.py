@@ -19,6 +19,13 @@ from models.job import Job
 from utils.rate_limiter import RateLimiter
 from utils.logger import get_logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional
+    import json
+    _json_loads = json.loads
+
 
 class BaseScraper(ABC):
     """
@@ -63,8 +70,22 @@ class BaseScraper(ABC):
         # Logger
         self.logger = get_logger(f"scraper.{name.lower()}")
         
-        # HTTP client (created lazily)
+        # HTTP client (created lazily, or shared via use_client())
         self._client: Optional[httpx.AsyncClient] = None
+        self._owns_client = True
+    
+    def use_client(self, client: Optional[httpx.AsyncClient]):
+        """
+        Use a shared HTTP client (connection pool shared across scrapers).
+        
+        A shared client is not closed by close(). Pass None to go back to
+        a lazily created private client.
+        
+        Args:
+            client: Shared AsyncClient, or None
+        """
+        self._client = client
+        self._owns_client = client is None
     
     async def _get_client(self) -> httpx.AsyncClient:
         """
@@ -84,10 +105,27 @@ class BaseScraper(ABC):
         return self._client
     
     async def close(self):
-        """Close HTTP client."""
-        if self._client is not None:
+        """Close HTTP client (a shared client is only detached)."""
+        if self._client is not None and self._owns_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
+        self._owns_client = True
+    
+    @staticmethod
+    def _parse_json(response: httpx.Response) -> Any:
+        """
+        Decode JSON response body (uses orjson if installed).
+        
+        Args:
+            response: HTTP response with a UTF-8 JSON body
+        
+        Returns:
+            Decoded JSON
+        
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        return _json_loads(response.content)
     
     @retry(
         retry=retry_if_exception_type((httpx.HTTPError, asyncio.TimeoutError)),
@@ -114,6 +152,9 @@ class BaseScraper(ABC):
         
         self.logger.info(f"Fetching: {url}")
         
+        # Keep per-scraper timeout when using a shared client
+        kwargs.setdefault('timeout', self.timeout)
+        
         client = await self._get_client()
         response = await client.get(url, **kwargs)
         response.raise_for_status()
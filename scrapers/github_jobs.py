@@ -75,12 +75,6 @@ class GitHubJobsScraper(BaseScraper):
         
         return []
     
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-    
     def parse_job(self, raw_data: Dict[str, Any]) -> Optional[Job]:
         """
         Parse job from raw data.
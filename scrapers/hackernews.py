@@ -113,7 +113,7 @@ class HackerNewsScraper(BaseScraper):
             }
             
             response = await self._fetch_url(self.ALGOLIA_URL, params=params)
-            data = response.json()
+            data = self._parse_json(response)
             
             hits = data.get('hits', [])
             
@@ -153,7 +153,7 @@ class HackerNewsScraper(BaseScraper):
             # Fetch thread item (includes comments)
             url = f"https://hn.algolia.com/api/v1/items/{thread_id}"
             response = await self._fetch_url(url)
-            data = response.json()
+            data = self._parse_json(response)
             
             comments = data.get('children', [])
             
@@ -146,7 +146,7 @@ class IndeedScraper(BaseScraper):
         
         # Fetch RSS feed
         client = await self._get_client()
-        response = await client.get(rss_url)
+        response = await client.get(rss_url, timeout=self.timeout)
         response.raise_for_status()
         
         # Parse XML
@@ -395,8 +395,3 @@ class IndeedScraper(BaseScraper):
         """
         self.logger.warning("parse_job() called on Indeed scraper - use fetch_jobs() instead")
         return None    
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
@@ -155,7 +155,7 @@ class StepStoneScraper(BaseScraper):
         
         # Fetch page
         client = await self._get_client()
-        response = await client.get(search_url)
+        response = await client.get(search_url, timeout=self.timeout)
         
         # Check response
         if response.status_code == 404:
@@ -360,8 +360,3 @@ class StepStoneScraper(BaseScraper):
     
 
     
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
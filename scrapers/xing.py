@@ -175,7 +175,7 @@ class XINGScraper(BaseScraper):
             "Accept-Language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7",
         }
         
-        response = await client.get(search_url, headers=headers)
+        response = await client.get(search_url, headers=headers, timeout=self.timeout)
         
         # Check response
         if response.status_code == 401 or response.status_code == 403:
@@ -402,8 +402,3 @@ class XINGScraper(BaseScraper):
     
 
     
-    async def close(self):
-        """Close HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
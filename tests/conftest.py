@@ -22,7 +22,7 @@ def test_settings(tmp_path):
     """Create test settings with temporary directories."""
     return Settings(
         cache_dir=str(tmp_path / "cache"),
-        log_dir=str(tmp_path / "logs"),
+        logs_dir=str(tmp_path / "logs"),
         log_level="DEBUG"
     )
 
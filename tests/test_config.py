@@ -1,5 +1,6 @@
 """Tests for configuration system."""
 
+import os
 import pytest
 from pathlib import Path
 from config.settings import Settings
@@ -53,7 +54,7 @@ def test_settings_min_score_validation():
 
 def test_load_profile_yaml(temp_config_dir):
     """Test loading profile from YAML."""
-    settings = Settings(config_dir=str(temp_config_dir))
+    settings = Settings(config_dir=str(temp_config_dir), cache_dir=str(temp_config_dir.parent / "cache"))
     profile = settings.load_profile()
     
     assert profile is not None
@@ -64,7 +65,7 @@ def test_load_profile_yaml(temp_config_dir):
 
 def test_load_scoring_rules(temp_config_dir):
     """Test loading scoring rules from YAML."""
-    settings = Settings(config_dir=str(temp_config_dir))
+    settings = Settings(config_dir=str(temp_config_dir), cache_dir=str(temp_config_dir.parent / "cache"))
     rules = settings.load_scoring_rules()
     
     assert rules is not None
@@ -74,7 +75,7 @@ def test_load_scoring_rules(temp_config_dir):
 
 def test_load_tech_dictionary(temp_config_dir):
     """Test loading tech dictionary from JSON."""
-    settings = Settings(config_dir=str(temp_config_dir))
+    settings = Settings(config_dir=str(temp_config_dir), cache_dir=str(temp_config_dir.parent / "cache"))
     tech_dict = settings.load_tech_dictionary()
     
     assert tech_dict is not None
@@ -82,6 +83,41 @@ def test_load_tech_dictionary(temp_config_dir):
     assert "C#" in tech_dict["languages"]
 
 
+def test_load_yaml_pickle_cache(temp_config_dir, tmp_path):
+    """Test parsed YAML is pickled to cache_dir and refreshed when the file changes."""
+    cache_dir = tmp_path / "cache"
+    settings = Settings(config_dir=str(temp_config_dir), cache_dir=str(cache_dir))
+    
+    rules = settings.load_scoring_rules()
+    assert list(cache_dir.glob("scoring_rules.yaml.*.pkl"))
+    
+    # Fresh instance (empty memo) is served from the pickle
+    fresh = Settings(config_dir=str(temp_config_dir), cache_dir=str(cache_dir), dev_mode=True)
+    assert fresh.load_scoring_rules() == rules
+    
+    # Newer source file invalidates the pickle
+    pickle_path = next(cache_dir.glob("scoring_rules.yaml.*.pkl"))
+    (temp_config_dir / "scoring_rules.yaml").write_text("scoring: {}\n")
+    os.utime(pickle_path, (0, 0))
+    other = Settings(config_dir=str(temp_config_dir), cache_dir=str(cache_dir), max_results=5)
+    assert other.load_scoring_rules() == {"scoring": {}}
+
+
+def test_load_yaml_memoized_per_instance(temp_config_dir, tmp_path):
+    """Test loaded configs are memoized on the Settings instance itself."""
+    kwargs = dict(config_dir=str(temp_config_dir), cache_dir=str(tmp_path / "cache"))
+    settings = Settings(**kwargs)
+    
+    assert settings.load_scoring_rules() is settings.load_scoring_rules()
+    assert settings.load_profile() is settings.load_profile()
+    
+    # Equal settings do not share (or keep alive) each other's results
+    other = Settings(**kwargs)
+    assert other == settings
+    assert other._memo == {}
+    assert other.load_scoring_rules() is not settings.load_scoring_rules()
+
+
 def test_directory_creation(tmp_path):
     """Test that Settings creates necessary directories."""
     cache_dir = tmp_path / "cache"
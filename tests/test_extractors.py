@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 
-from extractors.tech_extractor import TechStackExtractor
+from extractors.tech_extractor import TechStackExtractor, get_tech_extractor
 
 
 class TestTechStackExtractor:
@@ -30,7 +30,7 @@ class TestTechStackExtractor:
         
         tech_stack = extractor.extract(description)
         
-        assert isinstance(tech_stack, set)
+        assert isinstance(tech_stack, frozenset)
         assert len(tech_stack) > 0
         
         # Check for expected terms (case-insensitive)
@@ -101,6 +101,12 @@ class TestTechStackExtractor:
         assert extractor.extract("") == set()
         assert extractor.extract(None) == set()
     
+    def test_extract_text_without_letters(self, extractor):
+        """Test extraction short-circuits on text with no letters."""
+        assert extractor.extract("123 - 456 / 789 ###") == set()
+        assert extractor.extract("R") == {"R"}
+        assert extractor.extract("C") == {"C"}
+    
     def test_extract_no_tech(self, extractor):
         """Test extraction with no tech terms."""
         description = "We are a great company looking for passionate people."
@@ -159,7 +165,7 @@ class TestTechStackExtractor:
         # Should have some categories
         all_tech = set()
         for category, tech_set in categorized.items():
-            assert isinstance(tech_set, set)
+            assert isinstance(tech_set, frozenset)
             all_tech.update(tech_set)
         
         # Total should match extract() result
@@ -176,6 +182,51 @@ class TestTechStackExtractor:
         assert "\n" not in processed
         assert "\t" not in processed
     
+    def test_extract_result_cache(self, extractor, monkeypatch):
+        """Test repeated texts are served from the bounded LRU cache."""
+        monkeypatch.setattr(extractor, "CACHE_SIZE", 2)
+        first = extractor.extract("Python and Docker")
+        
+        assert extractor.extract("Python   and Docker") is first
+        
+        extractor.extract("React developer")
+        extractor.extract("Kubernetes operator")
+        assert len(extractor._cache) == 2
+        assert "Python and Docker" not in extractor._cache
+    
+    def test_extract_batch(self, extractor):
+        """Test batch extraction matches per-text extraction."""
+        texts = ["Python and Docker", "React developer", "", "Python and Docker"]
+        
+        results = extractor.extract_batch(texts)
+        
+        assert results == [extractor.extract(text) for text in texts]
+        assert results[0] is results[3]
+    
+    def test_extract_batch_process_pool(self, extractor, monkeypatch):
+        """Test batch extraction through the process pool."""
+        monkeypatch.setattr(extractor, "PARALLEL_MIN_TEXTS", 2)
+        texts = ["Python and Docker", "React developer", "Python and Docker"]
+        
+        results = extractor.extract_batch(texts, processes=2)
+        
+        assert results == [extractor.extract(text) for text in texts]
+        
+        # Later batches reuse the running pool
+        executor = extractor._executor
+        assert executor is not None
+        assert extractor.extract_batch(texts[::-1], processes=2) == results[::-1]
+        assert extractor._executor is executor
+        
+        extractor.close()
+        assert extractor._executor is None
+    
+    def test_extract_from_bytes(self, extractor):
+        """Test extraction from raw UTF-8 bytes."""
+        assert extractor.preprocess_text(b"  Python \n\t  Django  ") == "Python Django"
+        assert extractor.extract("Python and Docker".encode("utf-8")) == \
+            extractor.extract("Python and Docker")
+    
     def test_duplicate_removal(self, extractor):
         """Test that duplicates are removed."""
         description = "Python Python Python React React"
@@ -194,3 +245,9 @@ class TestTechStackExtractor:
         
         # Should extract .NET (might merge variants)
         assert any('.net' in t.lower() for t in tech_stack)
+
+
+def test_get_tech_extractor_is_shared():
+    """Test that get_tech_extractor() builds the extractor only once."""
+    assert get_tech_extractor() is get_tech_extractor()
+    assert isinstance(get_tech_extractor(), TechStackExtractor)
@@ -0,0 +1,80 @@
+"""Tests for Google Sheets integration."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from gspread.http_client import HTTPClient
+from gspread.worksheet import Worksheet
+
+from integrations.google_sheets import GoogleSheetsWriter
+
+
+class TestGoogleSheetsWriter:
+    """Tests for GoogleSheetsWriter."""
+    
+    @pytest.fixture
+    def spreadsheet(self) -> MagicMock:
+        """Create mocked spreadsheet."""
+        return MagicMock()
+    
+    @pytest.fixture
+    def grid(self) -> dict:
+        """Server-side grid properties of the 'Jobs' worksheet."""
+        return {'rowCount': 3, 'columnCount': 13}
+    
+    @pytest.fixture
+    def writer(self, tmp_path, spreadsheet, grid) -> GoogleSheetsWriter:
+        """Create writer with mocked spreadsheet/worksheet handles."""
+        writer = GoogleSheetsWriter(credentials_path=str(tmp_path / "missing.json"))
+        writer.enabled = True
+        writer._spreadsheet = spreadsheet
+        spreadsheet.worksheet.side_effect = lambda title: Worksheet(
+            spreadsheet,
+            {'sheetId': 7, 'title': title, 'index': 0, 'gridProperties': dict(grid)},
+            'spreadsheet-id',
+            MagicMock(spec=HTTPClient)
+        )
+        return writer
+    
+    @staticmethod
+    def _sent_requests(spreadsheet, call_index):
+        """Return requests sent by the given batch_update call."""
+        return spreadsheet.batch_update.call_args_list[call_index].args[0]['requests']
+    
+    def test_write_jobs_twice_refetches_grown_worksheet(self, writer, spreadsheet, grid, mock_job_list):
+        """Test worksheet handle is re-fetched after appendDimension."""
+        assert writer.write_jobs(mock_job_list, sheet_name='Jobs') is True
+        
+        first = self._sent_requests(spreadsheet, 0)
+        assert first[0] == {
+            'appendDimension': {'sheetId': 7, 'dimension': 'ROWS', 'length': 3}
+        }
+        assert 'Jobs' not in writer._worksheets
+        grid['rowCount'] = 6
+        
+        assert writer.write_jobs(mock_job_list[:2], sheet_name='Jobs') is True
+        
+        second = self._sent_requests(spreadsheet, 2)
+        assert not any('appendDimension' in request for request in second)
+        clear = second[1]['updateCells']['range']
+        assert (clear['startRowIndex'], clear['endRowIndex']) == (3, 6)
+        assert spreadsheet.worksheet.call_count == 2
+        assert 'Jobs' in writer._worksheets
+    
+    def test_formatting_failure_keeps_write(self, writer, spreadsheet, mock_job_list):
+        """Test a rejected formatting batch does not fail the write."""
+        spreadsheet.batch_update.side_effect = [None, RuntimeError("bad format request")]
+        
+        assert writer.write_jobs(mock_job_list, sheet_name='Jobs') is True
+        assert spreadsheet.batch_update.call_count == 2
+        assert 'repeatCell' in str(self._sent_requests(spreadsheet, 1))
+    
+    def test_jobs_to_rows_matches_job_to_row(self, writer, mock_job_list, sample_score_result):
+        """Test batched rows equal per-job rows, with and without scores."""
+        scores = {mock_job_list[0].id: sample_score_result}
+        
+        rows = writer._jobs_to_rows(mock_job_list, scores)
+        
+        assert rows == [writer._job_to_row(job, scores) for job in mock_job_list]
+        assert rows[0][7:9] == ["75.5", "tfidf_similarity:0.0, tech_stack:0.0, remote_type:0.0, keywords:0.0, contract_type:0.0"]
+        assert rows[1][7:9] == ["", ""]
@@ -270,3 +270,12 @@ class TestEdgeCases:
         result = location_scorer.calculate(job, basic_profile)
         
         assert result.score == 15.0  # Both city and region match
+    
+    def test_repeated_location_cached(self, location_scorer, basic_profile):
+        """Test repeated locations reuse the cached term matches."""
+        first = location_scorer.calculate(create_job(location="Wien, Österreich"), basic_profile)
+        second = location_scorer.calculate(create_job(location="Wien, Österreich"), basic_profile)
+        
+        assert first.score == second.score
+        assert first.details == second.details
+        assert location_scorer._match_location.cache_info().hits == 1
@@ -3,6 +3,7 @@
 import pytest
 import numpy as np
 
+from matchers.keyword_matcher import KeywordMatcher
 from matchers.tfidf_matcher import TfidfMatcher
 
 
@@ -54,6 +55,42 @@ class TestTfidfMatcher:
         assert matcher.calculate_similarity("some text", "") == 0.0
         assert matcher.calculate_similarity("", "") == 0.0
     
+    def test_calculate_similarity_cached(self, matcher):
+        """Test repeated text pairs reuse the pairwise similarity."""
+        text1 = "Python Django backend developer"
+        text2 = "Senior Python developer with Django"
+        
+        first = matcher.calculate_similarity(text1, text2)
+        second = matcher.calculate_similarity(text1, text2)
+        
+        assert first == second
+        assert matcher._pair_similarity.cache_info().hits == 1
+    
+    def test_pairwise_hashing_similarity(self):
+        """Test hashed pairwise similarity without fitting."""
+        matcher = TfidfMatcher(pairwise_hashing=True)
+        text = "Python developer with Django and REST APIs"
+        
+        assert matcher.calculate_similarity(text, text) == pytest.approx(1.0)
+        assert matcher.calculate_similarity(text, "Marketing manager with sales experience") < 0.3
+        assert not hasattr(matcher._small_vectorizer, 'vocabulary_')
+    
+    def test_calculate_similarities_matches_pairwise(self, matcher):
+        """Test batched similarities equal per-pair similarities."""
+        profile_text = "Senior Python developer with Django, REST APIs and Docker"
+        texts = [
+            "Python Django backend developer",
+            "Marketing manager with sales experience",
+            "Docker and Kubernetes engineer, Python scripting",
+            "",
+        ]
+        
+        similarities = matcher.calculate_similarities(texts, profile_text)
+        
+        assert len(similarities) == len(texts)
+        for text, similarity in zip(texts, similarities):
+            assert similarity == pytest.approx(matcher.calculate_similarity(text, profile_text))
+    
     def test_similarity_range(self, matcher):
         """Test that similarity is always in [0, 1] range."""
         text1 = "Python developer"
@@ -76,6 +113,58 @@ class TestTfidfMatcher:
         assert matcher._is_fitted is True
         assert matcher._corpus_vectors is not None
     
+    def test_save_and_load_corpus(self, matcher, tmp_path):
+        """Test fitted corpus survives save() / load()."""
+        corpus = [
+            "Python Django backend developer",
+            "React TypeScript frontend",
+        ]
+        matcher.fit(corpus)
+        expected = matcher.calculate_similarity_to_corpus("Python Django")
+        
+        matcher.save(tmp_path / "tfidf")
+        
+        loaded = TfidfMatcher()
+        assert loaded.load(tmp_path / "tfidf") is True
+        assert loaded.calculate_similarity_to_corpus("Python Django").tolist() == expected.tolist()
+        assert TfidfMatcher().load(tmp_path / "missing") is False
+    
+    def test_partial_fit_matches_full_fit(self, matcher):
+        """Test partial_fit gives the same vectors as fitting all documents."""
+        corpus = [
+            "Python Django backend developer",
+            "React TypeScript frontend",
+            "Full stack with Python and React",
+        ]
+        new_docs = ["Python backend with Django and React"]
+        
+        matcher.fit(corpus)
+        matcher.partial_fit(new_docs)
+        
+        full = TfidfMatcher()
+        full.fit(corpus)
+        full.vectorizer.set_params(vocabulary=full.vectorizer.vocabulary_)
+        full.fit(corpus + new_docs)
+        
+        assert matcher._corpus_vectors.shape == (4, len(matcher.get_feature_names()))
+        assert np.allclose(
+            matcher._corpus_vectors.toarray(),
+            full._corpus_vectors.toarray(),
+            atol=1e-6
+        )
+    
+    def test_query_vector_cache_follows_corpus(self, matcher):
+        """Test cached query vectors are refreshed when the corpus changes."""
+        query = "Python backend developer"
+        
+        matcher.fit(["Python Django backend developer", "React TypeScript frontend"])
+        first = matcher.calculate_similarity_to_corpus(query)
+        assert np.array_equal(matcher.calculate_similarity_to_corpus(query), first)
+        
+        matcher.partial_fit(["Python backend with Django and React"])
+        expected = (matcher.vectorizer.transform([query]) @ matcher._corpus_vectors.T).toarray().ravel()
+        assert np.allclose(matcher.calculate_similarity_to_corpus(query), expected)
+    
     def test_calculate_similarity_to_corpus(self, matcher):
         """Test calculating similarity to corpus."""
         corpus = [
@@ -142,6 +231,27 @@ class TestTfidfMatcher:
         words = [k.lower() for k in scores.keys()]
         assert any('python' in w for w in words)
     
+    def test_get_top_terms_matches_tfidf_scores(self, matcher):
+        """Test batched top terms equal the top get_tfidf_scores() terms."""
+        texts = [
+            "Python developer with Python and Django experience",
+            "Java Spring developer, Java microservices on AWS",
+        ]
+        
+        top_terms = matcher.get_top_terms(texts, 3)
+        
+        assert top_terms == [list(matcher.get_tfidf_scores(text))[:3] for text in texts]
+    
+    def test_get_top_terms_cached(self, matcher):
+        """Test top terms are computed once per text."""
+        texts = ["Python Django backend developer", "React TypeScript frontend"]
+        
+        first = matcher.get_top_terms(texts, 3)
+        assert len(matcher._top_terms_cache) == 2
+        
+        assert matcher.get_top_terms(texts[::-1], 3) == first[::-1]
+        assert len(matcher._top_terms_cache) == 2
+    
     def test_job_profile_similarity(self, matcher):
         """Test realistic job description vs profile similarity."""
         job_description = """
@@ -199,3 +309,29 @@ class TestTfidfMatcher:
         
         # Should be 1.0 for identical words
         assert 0.99 <= similarity <= 1.0
+
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher."""
+    
+    def test_find_first_search(self):
+        """Test substring matching of multiple keywords."""
+        matcher = KeywordMatcher(["remote", "asap", "vor ort", "remote"])
+        text = "senior developer, remote, start asap"
+        
+        assert matcher.keywords == ("remote", "asap", "vor ort")
+        assert matcher.find(text) == {"remote", "asap"}
+        assert matcher.first(text) == "remote"
+        assert matcher.first("start asap") == "asap"
+        assert matcher.first("berlin") is None
+        assert matcher.search(text) is True
+        assert matcher.search("berlin") is False
+    
+    def test_find_longest(self):
+        """Test keywords only found inside longer keywords are dropped."""
+        matcher = KeywordMatcher(["vor ort", "3-5 tage vor ort", "remote"])
+        
+        assert matcher.find_longest("3-5 tage vor ort") == {"3-5 tage vor ort"}
+        assert matcher.find_longest("vor ort, 3-5 tage vor ort") == {"vor ort", "3-5 tage vor ort"}
+        assert matcher.find_longest("remote, vor ort") == {"remote", "vor ort"}
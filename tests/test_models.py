@@ -77,6 +77,29 @@ class TestJob:
         old_job = Job(**old_job_data)
         assert old_job.is_fresh(max_age_days=7) is False
     
+    def test_get_text_lower(self, sample_job):
+        """Test cached lowercased title + description."""
+        text = sample_job.get_text_lower()
+        
+        assert text == f"{sample_job.title} {sample_job.description}".lower()
+        assert sample_job.get_text_lower() is text
+        assert "_text_lower" not in sample_job.to_dict()
+        
+        # Reassigned fields are picked up
+        sample_job.title = "Data Engineer"
+        assert sample_job.get_text_lower().startswith("data engineer ")
+    
+    def test_get_tech_stack_lower(self, sample_job):
+        """Test cached lowercased tech stack."""
+        tech = sample_job.get_tech_stack_lower()
+        
+        assert tech == {t.lower() for t in sample_job.tech_stack}
+        assert sample_job.get_tech_stack_lower() is tech
+        
+        # Reassigned tech stack is picked up
+        sample_job.tech_stack = ["Go", "Kubernetes"]
+        assert sample_job.get_tech_stack_lower() == {"go", "kubernetes"}
+    
     def test_to_dict(self, sample_job):
         """Test job serialization to dict."""
         job_dict = sample_job.to_dict()
@@ -158,6 +181,13 @@ class TestProfile:
         assert "C#" in skills
         assert ".NET" in skills
     
+    def test_get_skills_lower(self, sample_profile):
+        """Test cached lowercased skill names."""
+        skills = sample_profile.get_skills_lower()
+        
+        assert skills == {s.lower() for s in sample_profile.get_all_skills_flat()}
+        assert sample_profile.get_skills_lower() is skills
+    
     def test_get_high_proficiency_skills(self, sample_profile):
         """Test filtering high proficiency skills."""
         expert_skills = sample_profile.get_high_proficiency_skills(min_level="Expert")
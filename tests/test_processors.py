@@ -1,7 +1,7 @@
 """Tests for processors (filter, deduplicator)."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from models.job import Job
 from processors.filter import JobFilter
@@ -117,6 +117,16 @@ class TestJobFilter:
         cutoff = datetime.now() - timedelta(days=7)
         assert all(job.posted_date >= cutoff for job in filtered)
     
+    def test_filter_by_age_timezone_aware(self, filter, sample_jobs):
+        """Test age filter accepts timezone-aware posting dates."""
+        sample_jobs[0].posted_date = datetime.now(timezone.utc) - timedelta(days=2)
+        sample_jobs[2].posted_date = datetime.now(timezone.utc) - timedelta(days=20)
+        
+        criteria = {'max_age_days': 7}
+        filtered = filter.apply(sample_jobs, criteria)
+        
+        assert [job.id for job in filtered] == ["job1", "job4"]
+    
     def test_filter_by_role_keywords(self, filter, sample_jobs):
         """Test role keywords filtering."""
         criteria = {'role_keywords': ['Full Stack', 'Backend']}
@@ -143,6 +153,17 @@ class TestJobFilter:
         assert len(filtered) == 2
         assert all('remote' in job.remote_type.lower() for job in filtered)
     
+    def test_filter_by_seniority(self, filter, sample_jobs):
+        """Test Senior/Lead titles are excluded, but not SRE."""
+        sample_jobs[1].title = "Sr. Frontend Developer"
+        sample_jobs[2].title = "Teamlead Backend"
+        sample_jobs[3].title = "SRE Engineer"
+        
+        criteria = {'exclude_senior_lead': True}
+        filtered = filter.apply(sample_jobs, criteria)
+        
+        assert [job.id for job in filtered] == ["job4"]
+    
     def test_filter_by_contract_type(self, filter, sample_jobs):
         """Test contract type filtering."""
         # Add contract types to some jobs
@@ -309,6 +330,43 @@ class TestDeduplicator:
         # With high threshold (0.95), these might not be considered duplicates
         assert len(unique) >= 1
     
+    def test_similar_duplicate_among_unrelated_jobs(self, deduplicator):
+        """Test similar duplicates are found past unrelated retained jobs."""
+        titles = [
+            ("Senior Full Stack Engineer", "TechCorp"),
+            ("Backend Engineer Python", "DataCo"),
+            ("Frontend Developer React", "WebAG"),
+            ("Senior Full-Stack Engineer", "TechCorp GmbH"),
+            # Similar (0.853) although the titles share no trigram
+            ("abcdefghijklmnopqrstuvwxyz012345", "SameCo"),
+            ("bc-de-fg-hi-jk-lm-no-pq-rs-tu-vw-xy-z0-12-34", "SameCo"),
+        ]
+        jobs = [
+            Job(
+                id=f"j{i}",
+                title=title,
+                company=company,
+                location="Berlin",
+                remote_type="Remote",
+                url=f"https://example.com/{i}",
+                description=f"Job description for {title} at {company}",
+                posted_date=datetime.now(),
+                source="test"
+            )
+            for i, (title, company) in enumerate(titles)
+        ]
+        
+        unique = deduplicator.remove_duplicates(jobs)
+        
+        assert [job.id for job in unique] == ["j0", "j1", "j2", "j4"]
+        
+        # find_duplicates reports the trigram-disjoint pair as well
+        pairs = {
+            (job1.id, job2.id): similarity
+            for job1, job2, similarity in deduplicator.find_duplicates(jobs)
+        }
+        assert pairs[("j4", "j5")] == pytest.approx(0.8526, abs=1e-4)
+    
     def test_find_duplicates(self, deduplicator, jobs_with_duplicates):
         """Test finding duplicate pairs."""
         duplicates = deduplicator.find_duplicates(jobs_with_duplicates)
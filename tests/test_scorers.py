@@ -246,6 +246,57 @@ class TestRemoteComponent:
         assert component.normalize_score(-3, -3, 5) == 0.0  # Min raw → 0
         assert component.normalize_score(5, -3, 5) == 15.0  # Max raw → 15
         assert abs(component.normalize_score(0, -3, 5) - 5.625) < 0.01  # Mid
+    
+    def test_normalize_scores_matches_normalize_score(self):
+        """Test vectorized normalization matches the scalar version."""
+        component = RemoteComponent(max_score=15.0)
+        raw_scores = [-10, -3, 0, 2.5, 5, 12]
+        
+        assert component.normalize_scores(raw_scores, -3, 5).tolist() == [
+            component.normalize_score(raw, -3, 5) for raw in raw_scores
+        ]
+    
+    def test_match_patterns_matches_each_pattern(self):
+        """Test literal/combined matching agrees with searching each pattern."""
+        component = RemoteComponent(max_score=15.0)
+        texts = [
+            ("", "Täglich VOR ORT in Berlin"),
+            ("Hybrid", "2 Tage pro Woche im Büro, sonst Homeoffice"),
+            ("", "Hybrid: 1 day per week in the office"),
+            ("Remote", "We are a Distributed Team"),
+            ("", "Python developer in Munich"),
+        ]
+        
+        for remote_type, description in texts:
+            combined_text = f"{remote_type} {description}"
+            expected = (0.0, "unknown (assumed hybrid)")
+            for type_name in component.MATCH_ORDER:
+                config = component.patterns[type_name]
+                if any(p.search(combined_text) for p in config['patterns']):
+                    expected = (config['score'], type_name)
+                    break
+        
+            assert component._match_patterns(description, remote_type) == expected
+    
+    def test_repeated_description_cached(self, profile):
+        """Test a description scored again (e.g. for another profile) is not rescanned."""
+        job = Job(
+            id="test",
+            title="Developer",
+            company="Test",
+            location="Berlin",
+            url="https://test.com",
+            description="Hybrid: 2 Tage pro Woche im Büro in Berlin",
+            posted_date=datetime.now(),
+            source="test"
+        )
+        
+        component = RemoteComponent(max_score=15.0)
+        first = component.calculate(job, profile)
+        second = component.calculate(job, profile)
+        
+        assert second.raw_score == first.raw_score
+        assert component._match_patterns.cache_info().hits == 1
 
 
 class TestKeywordComponent:
@@ -296,6 +347,32 @@ class TestKeywordComponent:
         # Should have negative raw score, but normalized floors at 0
         assert result.raw_score < 0
         assert result.score == 0.0
+    
+    def test_nested_keywords_not_double_counted(self, profile):
+        """Test a keyword inside a longer matched keyword counts once."""
+        component = KeywordComponent(max_score=10.0)
+        
+        def make_job(description):
+            return Job(
+                id="test",
+                title="Developer",
+                company="Test",
+                location="Berlin",
+                url="https://test.com",
+                description=description,
+                posted_date=datetime.now(),
+                source="test"
+            )
+        
+        # "vor ort" only occurs inside "3-5 tage vor ort"
+        result = component.calculate(make_job("Hybrid role, 3-5 Tage vor Ort"), profile)
+        assert result.details['matched_keywords'] == {"3-5 tage vor ort": -3}
+        
+        # ...but counts when it also occurs on its own
+        result = component.calculate(
+            make_job("3-5 Tage vor Ort, Onboarding vor Ort in Berlin"), profile
+        )
+        assert result.raw_score == -5.0
 
 
 class TestContractComponent:
@@ -348,6 +425,26 @@ class TestContractComponent:
         # Praktikum = -5 raw → 0.0 normalized
         assert result.raw_score == -5.0
         assert result.score == 0.0
+    
+    def test_contract_rule_order_precedence(self, profile):
+        """Test earlier rules win (unbefristet over its substring befristet)."""
+        job = Job(
+            id="test",
+            title="Backend Developer",
+            company="Test",
+            location="Berlin",
+            contract_type="Unbefristet",
+            url="https://test.com",
+            description="Unbefristete Festanstellung, kein befristeter Vertrag",
+            posted_date=datetime.now(),
+            source="test"
+        )
+        
+        component = ContractComponent(max_score=5.0)
+        result = component.calculate(job, profile)
+        
+        assert result.details['matched_type'] == "unbefristet"
+        assert result.raw_score == 1.0
 
 
 class TestScoreAggregator:
@@ -403,6 +500,85 @@ class TestScoreAggregator:
         # Should be equal (within floating point precision)
         assert abs(component_sum - result.score) < 0.01
     
+    def test_score_jobs_matches_score_job(self, sample_job, profile):
+        """Test batch scoring gives the same results as per-job scoring."""
+        aggregator = ScoreAggregator()
+        other_job = sample_job.model_copy(
+            update={'id': 'other', 'remote_type': 'Onsite only'}
+        )
+        
+        results = aggregator.score_jobs([sample_job, other_job], profile)
+        
+        assert len(results) == 2
+        assert results[0].score == aggregator.score_job(sample_job, profile).score
+        assert results[1].score == aggregator.score_job(other_job, profile).score
+    
+    def test_shared_text_scan_matches_components(self, profile):
+        """Test the shared text scan scores like the components' own scans."""
+        aggregator = ScoreAggregator()
+        job = Job(
+            id="test",
+            title="Freelance Developer",
+            company="Test",
+            location="Berlin",
+            contract_type="Freiberuflich",
+            url="https://test.com",
+            description="Remote-first team, Projektstart asap, 3-5 Tage vor Ort",
+            posted_date=datetime.now(),
+            source="test"
+        )
+        
+        breakdown = aggregator.score_job(job, profile).breakdown
+        
+        for name in ('keywords', 'contract'):
+            expected = aggregator.components[name].calculate(job, profile)
+            assert breakdown[name]['raw'] == expected.raw_score
+            assert breakdown[name]['normalized'] == expected.score
+    
+    def test_score_jobs_for_profiles(self, sample_job, profile):
+        """Test scoring against several profiles matches per-profile scoring."""
+        aggregator = ScoreAggregator()
+        office_profile = profile.model_copy(update={
+            'preferences': {**profile.preferences, 'remote': 'office'}
+        })
+        jobs = [sample_job, sample_job.model_copy(update={'id': 'other', 'title': 'Data Engineer'})]
+        
+        results = aggregator.score_jobs_for_profiles(jobs, [profile, office_profile], max_workers=2)
+        
+        assert len(results) == 2
+        for profile_results, p in zip(results, [profile, office_profile]):
+            assert [r.score for r in profile_results] == [
+                r.score for r in aggregator.score_jobs(jobs, p)
+            ]
+    
+    def test_score_jobs_concurrent_components(self, sample_job, profile):
+        """Test components scored in a thread pool give the same results."""
+        aggregator = ScoreAggregator()
+        jobs = [sample_job, sample_job.model_copy(update={'id': 'other', 'title': 'Data Engineer'})]
+        
+        concurrent = aggregator.score_jobs(jobs, profile, max_workers=3)
+        sequential = aggregator.score_jobs(jobs, profile)
+        
+        assert [r.score for r in concurrent] == [r.score for r in sequential]
+        assert [r.breakdown for r in concurrent] == [r.breakdown for r in sequential]
+    
+    def test_hard_reject_keywords(self, sample_job, profile):
+        """Test jobs with a hard-reject title keyword skip scoring with score 0."""
+        aggregator = ScoreAggregator()
+        reject_profile = profile.model_copy(update={
+            'preferences': {**profile.preferences, 'hard_reject_keywords': ['Praktikum']}
+        })
+        internship = sample_job.model_copy(
+            update={'id': 'intern', 'title': 'Praktikum Softwareentwicklung'}
+        )
+        
+        results = aggregator.score_jobs([internship, sample_job], reject_profile)
+        
+        assert results[0].score == 0.0
+        assert "praktikum" in results[0].explanation
+        assert set(results[0].breakdown) == set(aggregator.components)
+        assert results[1].score == aggregator.score_job(sample_job, profile).score
+    
     def test_perfect_match_job(self, profile):
         """Test job with perfect match on all components."""
         job = Job(